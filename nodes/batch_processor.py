@@ -18,6 +18,41 @@ import torch  # type: ignore[import-not-found]
 logger = logging.getLogger("ffmpega")
 
 
+def _batch_worker_count(
+    registry,
+    pipeline_steps: list[dict],
+    max_concurrent: int,
+    file_count: int,
+) -> int:
+    """Size the batch worker pool from the pipeline's skills.
+
+    When every step is an I/O-bound stream-copy skill (``batch_parallel``
+    > 1), per-process startup dominates, so the pool is widened up to the
+    smallest such hint (bounded by CPU count).  Otherwise the user's
+    ``max_concurrent`` is used unchanged.
+    """
+    hints = []
+    for step in pipeline_steps:
+        skill = registry.get(step.get("skill", ""))
+        hints.append(skill.batch_parallel if skill is not None else 1)
+
+    workers = max_concurrent
+    if hints and min(hints) > 1:
+        workers = max(workers, min(min(hints), os.cpu_count() or 1))
+    return max(1, min(workers, file_count))
+
+
+def _batch_filter_threads(workers: int) -> int:
+    """Filter-graph thread cap per job, or 0 to leave ffmpeg's default.
+
+    libavfilter starts one thread per core for every job, so when several
+    jobs run at once the cores are split between them instead.
+    """
+    if workers <= 1:
+        return 0
+    return max(1, (os.cpu_count() or 1) // workers)
+
+
 async def process_batch(
     # dependencies (injected from agent node)
     analyzer,
@@ -146,7 +181,14 @@ async def process_batch(
     errors = []
     command_logs = []
 
-    def process_single(vpath: str) -> tuple[str, str | None, str]:
+    workers = _batch_worker_count(
+        composer.registry, pipeline_steps, max_concurrent, len(valid_files),
+    )
+    filter_threads = _batch_filter_threads(workers)
+
+    def process_single(
+        vpath: str, filter_threads: int = filter_threads,
+    ) -> tuple[str, str | None, str]:
         """Process one video file."""
         try:
             stem = Path(vpath).stem
@@ -160,6 +202,8 @@ async def process_batch(
             pipeline.metadata["_enable_flux_klein"] = use_flux_klein
             if flux_smoothing and flux_smoothing != "none":
                 pipeline.metadata["_flux_smoothing"] = flux_smoothing
+            if filter_threads:
+                pipeline.metadata["_filter_threads"] = filter_threads
             for step in pipeline_steps:
                 skill_name = step.get("skill")
                 params = step.get("params", {})
@@ -181,7 +225,7 @@ async def process_batch(
         except Exception as e:
             return (vpath, str(e), "")
 
-    with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+    with ThreadPoolExecutor(max_workers=workers) as executor:
         futures = {
             executor.submit(process_single, vf): vf
             for vf in valid_files
@@ -164,6 +164,8 @@ async def process_effects_pipeline(
     if video_metadata.primary_video:
         pipeline.metadata["_input_width"] = video_metadata.primary_video.width
         pipeline.metadata["_input_height"] = video_metadata.primary_video.height
+    if video_metadata.primary_audio and video_metadata.primary_audio.sample_rate:
+        pipeline.metadata["_input_sample_rate"] = video_metadata.primary_audio.sample_rate
 
     # SAM3 preferences (for auto_mask steps)
     pipeline.metadata["_sam3_device"] = sam3_device
@@ -138,6 +138,8 @@ def assemble_pipeline(
     if video_metadata.primary_video:
         pipeline.metadata["_input_width"] = video_metadata.primary_video.width
         pipeline.metadata["_input_height"] = video_metadata.primary_video.height
+    if video_metadata.primary_audio and video_metadata.primary_audio.sample_rate:
+        pipeline.metadata["_input_sample_rate"] = video_metadata.primary_audio.sample_rate
 
     for step in pipeline_steps:
         skill_name = step.get("skill")
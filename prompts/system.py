@@ -1,13 +1,78 @@
 """System prompt template for FFMPEGA agent."""
 
-from typing import Optional
+import functools
+import re
+import string
+import sys
+from collections.abc import Iterator
+from typing import Any, Optional
 try:
     from ..skills.registry import get_registry
 except ImportError:
     from skills.registry import get_registry
 
 
-SYSTEM_PROMPT_TEMPLATE = """You are FFMPEGA, an expert video editing agent. Your role is to interpret natural language video editing requests and translate them into precise FFMPEG operations.
+# Fallbacks substituted when the caller has no metadata / extra inputs
+_NO_VIDEO_INFO = "No video information available - assume standard video input"
+_NO_CONNECTED_INPUTS = "No extra inputs connected"
+
+
+def _split_template(template: str) -> tuple[tuple[str, str | None], ...]:
+    """Pre-split a ``string.Template``-style template into interned segments.
+
+    Each entry is ``(literal, field)`` where *literal* is the static text
+    and *field* is the ``$placeholder`` name that follows it, or ``None``
+    for the trailing text.  Templates use literal ``{``/``}`` for JSON, so
+    no brace escaping is needed and no template engine runs per call.
+    """
+    segments: list[tuple[str, str | None]] = []
+    pending: list[str] = []
+    pos = 0
+    for match in string.Template.pattern.finditer(template):
+        pending.append(template[pos:match.start()])
+        pos = match.end()
+        if match.group("invalid") is not None:
+            raise ValueError(f"Invalid placeholder in prompt template at {match.start()}")
+        field = match.group("named") or match.group("braced")
+        if field is None:
+            # "$$" escape
+            pending.append("$")
+            continue
+        segments.append((sys.intern("".join(pending)), field))
+        pending = []
+    pending.append(template[pos:])
+    segments.append((sys.intern("".join(pending)), None))
+    return tuple(segments)
+
+
+def _to_format_syntax(template: str) -> str:
+    """Convert a ``$placeholder`` template to ``str.format`` syntax.
+
+    The public ``*_TEMPLATE``/``*_PROMPT`` constants keep their historical
+    ``{field}`` / ``{{ }}`` form for callers that ``.format()`` them; the
+    renderers here work from the private ``$`` sources.
+    """
+    parts: list[str] = []
+    for literal, field in _split_template(template):
+        parts.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field is not None:
+            parts.append("{" + field + "}")
+    return "".join(parts)
+
+
+def _render_segments(
+    segments: tuple[tuple[str, str | None], ...], **values: str,
+) -> str:
+    """Join pre-split template segments with their placeholder values."""
+    parts: list[str] = []
+    for literal, field in segments:
+        parts.append(literal)
+        if field is not None:
+            parts.append(values[field])
+    return "".join(parts)
+
+
+_SYSTEM_PROMPT_SOURCE = """You are FFMPEGA, an expert video editing agent. Your role is to interpret natural language video editing requests and translate them into precise FFMPEG operations.
 
 ## Your Capabilities
 You have access to a comprehensive library of video editing skills organized into categories:
@@ -19,13 +84,13 @@ You have access to a comprehensive library of video editing skills organized int
 - **Outcome**: cinematic, blockbuster, documentary, vintage, vhs, sepia, neon, glitch, meme, timelapse, slowmo, stabilize, fade_to_black, fade_to_white, wipe, slide_in, iris_reveal, spin, shake, pulse, bounce, drift, ken_burns, zoom, boomerang, overlay_image, waveform, grid, slideshow, etc.
 
 ## Available Skills
-{skill_registry}
+$skill_registry
 
 ## Input Video Information
-{video_metadata}
+$video_metadata
 
 ## Connected Inputs
-{connected_inputs}
+$connected_inputs
 
 When the user references specific inputs by name (audio_a, audio_b, etc.), include
 "audio_source" in your response JSON to select the appropriate audio track.
@@ -58,15 +123,15 @@ Given the user's editing request, you must:
 ## Output Format
 ALWAYS respond with a valid JSON object in this exact format:
 ```json
-{{
+{
   "interpretation": "Brief explanation of what you understood from the request",
   "pipeline": [
-    {{"skill": "skill_name", "params": {{"param1": "value1"}}}},
-    {{"skill": "another_skill", "params": {{}}}}
+    {"skill": "skill_name", "params": {"param1": "value1"}},
+    {"skill": "another_skill", "params": {}}
   ],
   "warnings": ["Any potential issues or limitations"],
   "estimated_changes": "Brief description of how the output will differ from input"
-}}
+}
 ```
 
 ## Important Guidelines
@@ -85,207 +150,283 @@ ALWAYS respond with a valid JSON object in this exact format:
 User: "Make it brighter"
 Response:
 ```json
-{{
+{
   "interpretation": "Increase video brightness slightly",
   "pipeline": [
-    {{"skill": "brightness", "params": {{"value": 0.15}}}}
+    {"skill": "brightness", "params": {"value": 0.15}}
   ],
   "warnings": [],
   "estimated_changes": "Video will appear slightly brighter"
-}}
+}
 ```
 
 User: "Make it 720p and trim the first 5 seconds"
 Response:
 ```json
-{{
+{
   "interpretation": "Resize video to 720p resolution and remove the first 5 seconds",
   "pipeline": [
-    {{"skill": "trim", "params": {{"start": 5}}}},
-    {{"skill": "resize", "params": {{"width": 1280, "height": 720}}}}
+    {"skill": "trim", "params": {"start": 5}},
+    {"skill": "resize", "params": {"width": 1280, "height": 720}}
   ],
   "warnings": [],
   "estimated_changes": "Video will be 720p and 5 seconds shorter"
-}}
+}
 ```
 
 User: "Make it look cinematic"
 Response:
 ```json
-{{
+{
   "interpretation": "Apply cinematic treatment with letterbox and color grading",
   "pipeline": [
-    {{"skill": "cinematic", "params": {{"intensity": "medium"}}}}
+    {"skill": "cinematic", "params": {"intensity": "medium"}}
   ],
   "warnings": [],
   "estimated_changes": "Video will have 2.35:1 letterbox bars and cinematic color grading"
-}}
+}
 ```
 
 User: "Speed it up 2x but keep the pitch normal"
 Response:
 ```json
-{{
+{
   "interpretation": "Double playback speed while maintaining original audio pitch",
   "pipeline": [
-    {{"skill": "speed", "params": {{"factor": 2.0}}}}
+    {"skill": "speed", "params": {"factor": 2.0}}
   ],
   "warnings": [],
   "estimated_changes": "Video duration halved, audio pitch preserved"
-}}
+}
 ```
 
 User: "Make it all blue"
 Response:
 ```json
-{{
+{
   "interpretation": "Apply a strong blue color tint using color balance adjustments",
   "pipeline": [
-    {{"skill": "colorbalance", "params": {{"rs": -0.3, "gs": -0.3, "bs": 0.5, "rm": -0.3, "gm": -0.3, "bm": 0.5}}}},
-    {{"skill": "saturation", "params": {{"value": 1.5}}}}
+    {"skill": "colorbalance", "params": {"rs": -0.3, "gs": -0.3, "bs": 0.5, "rm": -0.3, "gm": -0.3, "bm": 0.5}},
+    {"skill": "saturation", "params": {"value": 1.5}}
   ],
   "warnings": [],
   "estimated_changes": "Video will have a strong blue color cast"
-}}
+}
 ```
 
 User: "Add black letterbox bars"
 Response:
 ```json
-{{
+{
   "interpretation": "Add cinematic letterbox bars to darken the top and bottom",
   "pipeline": [
-    {{"skill": "letterbox", "params": {{"ratio": "2.35:1", "color": "black"}}}}
+    {"skill": "letterbox", "params": {"ratio": "2.35:1", "color": "black"}}
   ],
   "warnings": [],
   "estimated_changes": "Video will have black letterbox bars at top and bottom"
-}}
+}
 ```
 
 User: "Show the audio waveform at the bottom"
 Response:
 ```json
-{{
+{
   "interpretation": "Overlay audio waveform visualization at the bottom of the video",
   "pipeline": [
-    {{"skill": "waveform", "params": {{"position": "bottom", "color": "white", "opacity": 0.8}}}}
+    {"skill": "waveform", "params": {"position": "bottom", "color": "white", "opacity": 0.8}}
   ],
   "warnings": [],
   "estimated_changes": "Audio waveform overlay will appear at the bottom of the video"
-}}
+}
 ```
 
 User: "Overlay the image in the top-right corner"
 Response:
 ```json
-{{
+{
   "interpretation": "Overlay the connected image_a on the video in the top-right corner",
   "pipeline": [
-    {{"skill": "overlay_image", "params": {{"position": "top-right", "scale": 0.25, "opacity": 1.0}}}}
+    {"skill": "overlay_image", "params": {"position": "top-right", "scale": 0.25, "opacity": 1.0}}
   ],
   "warnings": [],
   "estimated_changes": "Image from image_a will be overlaid in the top-right corner at 25% scale"
-}}
+}
 ```
 
 User: "Put a transparent logo in the top-left at 15% scale"
 Response:
 ```json
-{{
+{
   "interpretation": "Place the connected image as a transparent logo overlay in the top-left corner at 15% scale",
   "pipeline": [
-    {{"skill": "overlay_image", "params": {{"position": "top-left", "scale": 0.15, "opacity": 0.7, "margin": 10}}}}
+    {"skill": "overlay_image", "params": {"position": "top-left", "scale": 0.15, "opacity": 0.7, "margin": 10}}
   ],
   "warnings": [],
   "estimated_changes": "Logo from image_a will appear as a semi-transparent overlay in the top-left corner"
-}}
+}
 ```
 
 User: "Create a slideshow starting with the video"
 Response:
 ```json
-{{
+{
   "interpretation": "Create a slideshow that starts with the main video followed by the extra images",
   "pipeline": [
-    {{"skill": "slideshow", "params": {{"include_video": true, "duration_per_image": 3.0, "transition": "fade"}}}}
+    {"skill": "slideshow", "params": {"include_video": true, "duration_per_image": 3.0, "transition": "fade"}}
   ],
   "warnings": [],
   "estimated_changes": "Video plays first, then each extra image is shown for 3 seconds with fade transitions"
-}}
+}
 ```
 
 User: "Make a 2-column grid"
 Response:
 ```json
-{{
+{
   "interpretation": "Arrange the video and extra images in a 2-column grid layout",
   "pipeline": [
-    {{"skill": "grid", "params": {{"columns": 2, "gap": 4}}}}
+    {"skill": "grid", "params": {"columns": 2, "gap": 4}}
   ],
   "warnings": [],
   "estimated_changes": "Video and images arranged in a 2-column grid"
-}}
+}
 ```
 
 User: "Create a slideshow from these images with 3 seconds per image and fade transitions, add background music from the audio input"
 Response:
 ```json
-{{
+{
   "interpretation": "Create an image slideshow with fade transitions and looping background music",
   "audio_mode": "loop",
   "pipeline": [
-    {{"skill": "slideshow", "params": {{"duration_per_image": 3.0, "transition": "fade"}}}}
+    {"skill": "slideshow", "params": {"duration_per_image": 3.0, "transition": "fade"}}
   ],
   "warnings": [],
   "estimated_changes": "Images shown for 3 seconds each with fade transitions, audio loops to fill duration"
-}}
+}
 ```
 
 User: "Concatenate all video segments, overlay the logo in the bottom right at 15% scale, normalize audio, compress for web"
 (Assume: video is main input, image_a has the logo, images_b has a second video)
 Response:
 ```json
-{{
+{
   "interpretation": "Join video inputs in sequence, overlay logo from image_a, normalize audio, optimize for web",
   "pipeline": [
-    {{"skill": "concat", "params": {{}}}},
-    {{"skill": "overlay_image", "params": {{"position": "bottom-right", "scale": 0.15, "image_source": "image_a"}}}},
-    {{"skill": "normalize", "params": {{}}}},
-    {{"skill": "web_optimize", "params": {{}}}}
+    {"skill": "concat", "params": {}},
+    {"skill": "overlay_image", "params": {"position": "bottom-right", "scale": 0.15, "image_source": "image_a"}},
+    {"skill": "normalize", "params": {}},
+    {"skill": "web_optimize", "params": {}}
   ],
   "warnings": [],
   "estimated_changes": "Videos concatenated, logo in bottom-right, audio normalized, optimized for web"
-}}
+}
 ```
 Note: When using overlay_image with other multi-input skills, always set "image_source" to specify which input is the overlay image (e.g. "image_a", "image_b").
 
 User: "Auto-transcribe and burn subtitles"
 Response:
 ```json
-{{
+{
   "interpretation": "Transcribe video audio with Whisper AI and burn subtitles",
   "pipeline": [
-    {{"skill": "auto_transcribe", "params": {{"fontsize": 24, "fontcolor": "white"}}}}
+    {"skill": "auto_transcribe", "params": {"fontsize": 24, "fontcolor": "white"}}
   ],
   "warnings": ["First run downloads ~1.5GB Whisper model to ComfyUI/models/whisper/"],
   "estimated_changes": "Speech auto-detected and subtitles burned into the video"
-}}
+}
 ```
 
 User: "Add karaoke-style lyrics"
 Response:
 ```json
-{{
+{
   "interpretation": "Auto-transcribe and add karaoke word-by-word subtitles with progressive fill",
   "pipeline": [
-    {{"skill": "karaoke_subtitles", "params": {{"fontsize": 48, "fill_color": "yellow"}}}}
+    {"skill": "karaoke_subtitles", "params": {"fontsize": 48, "fill_color": "yellow"}}
   ],
   "warnings": ["First run downloads ~1.5GB Whisper model to ComfyUI/models/whisper/"],
   "estimated_changes": "Word-by-word karaoke subtitles with progressive yellow fill"
-}}
+}
 ```
 """
 
+# ⚡ Perf: split once at import so each call is a plain join of interned
+# static segments instead of running a template engine.
+_SYSTEM_PROMPT_SEGMENTS = _split_template(_SYSTEM_PROMPT_SOURCE)
+
+SYSTEM_PROMPT_TEMPLATE = _to_format_syntax(_SYSTEM_PROMPT_SOURCE)
+
+
+@functools.lru_cache(maxsize=4)
+def _abbreviated_registry_str(version: int) -> str:
+    """Group skill names by category for the abbreviated prompt.
+
+    Memoized on the registry version so the grouping runs once per
+    registry mutation instead of on every prompt build.
+    """
+    skill_names: dict[str, list[str]] = {}
+    for skill in get_registry().list_all():
+        title = skill._category_title
+        if title not in skill_names:
+            skill_names[title] = []
+        skill_names[title].append(skill.name)
+
+    lines = []
+    for title, names in skill_names.items():
+        lines.append(f"**{title}**: {', '.join(names)}")
+    return "\n".join(lines)
+
+
+def iter_system_prompt_segments(
+    video_metadata: str | None = None,
+    include_full_registry: bool = True,
+    connected_inputs: str = "",
+) -> Iterator[tuple[str, bool]]:
+    """Yield the system prompt as ``(segment_text, is_cacheable)`` pairs.
+
+    Lets transports that accept block-structured content (e.g. Anthropic
+    ``content`` lists) send the prompt without first joining it into one
+    large string.  Static template text and the skill registry are marked
+    cacheable; per-request video metadata and connected inputs are not.
+    The full registry is yielded one category chunk at a time.
+
+    Args:
+        video_metadata: Optional video analysis string.
+        include_full_registry: Whether to include full skill descriptions.
+        connected_inputs: Summary of connected inputs.
+
+    Yields:
+        Tuples of (segment text, whether the segment is static across calls).
+    """
+    registry = get_registry()
+    if include_full_registry:
+        registry_chunks = [text for _category, text in registry.iter_prompt_chunks()]
+    else:
+        registry_chunks = [_abbreviated_registry_str(registry.version)]
+
+    values = {
+        "video_metadata": video_metadata or _NO_VIDEO_INFO,
+        "connected_inputs": connected_inputs or _NO_CONNECTED_INPUTS,
+    }
+
+    for literal, field in _SYSTEM_PROMPT_SEGMENTS:
+        if literal:
+            yield literal, True
+        if field == "skill_registry":
+            for chunk in registry_chunks:
+                yield chunk, True
+        elif field is not None:
+            yield values[field], False
+
+
+# Rendered prompts for the current registry version, keyed on the call's
+# arguments.  Cleared whenever the registry version moves on.  Each entry
+# is a full prompt (~100 KB with the registry), so keep only a few.
+_PROMPT_CACHE_MAX = 8
+_prompt_cache: dict[tuple[bool, str, str], str] = {}
+_prompt_cache_version: int | None = None
+
 
 def get_system_prompt(
     video_metadata: Optional[str] = None,
@@ -302,36 +443,77 @@ def get_system_prompt(
     Returns:
         Formatted system prompt string.
     """
-    registry = get_registry()
-
-    if include_full_registry:
-        skill_registry = registry.to_prompt_string()
-    else:
-        # Abbreviated version
-        skills = registry.list_all()
-        skill_names = {}
-        for skill in skills:
-            cat = skill.category.value
-            if cat not in skill_names:
-                skill_names[cat] = []
-            skill_names[cat].append(skill.name)
-
-        lines = []
-        for cat, names in skill_names.items():
-            lines.append(f"**{cat.title()}**: {', '.join(names)}")
-        skill_registry = "\n".join(lines)
-
-    video_info = video_metadata or "No video information available - assume standard video input"
-    inputs_info = connected_inputs or "No extra inputs connected"
-
-    return SYSTEM_PROMPT_TEMPLATE.format(
-        skill_registry=skill_registry,
-        video_metadata=video_info,
-        connected_inputs=inputs_info,
+    global _prompt_cache_version
+    video_info = video_metadata or _NO_VIDEO_INFO
+    inputs_info = connected_inputs or _NO_CONNECTED_INPUTS
+
+    version = get_registry().version
+    if version != _prompt_cache_version:
+        _prompt_cache.clear()
+        _prompt_cache_version = version
+
+    # The strings are keyed directly.  A str caches its own hash, so a
+    # repeated metadata object is hashed once; a new one costs one pass
+    # over the metadata, not a re-render of the registry text.
+    key = (include_full_registry, video_info, inputs_info)
+    cached = _prompt_cache.get(key)
+    if cached is not None:
+        return cached
+
+    prompt = "".join(
+        text for text, _cacheable in iter_system_prompt_segments(
+            video_metadata=video_info,
+            include_full_registry=include_full_registry,
+            connected_inputs=inputs_info,
+        )
     )
 
+    if key not in _prompt_cache and len(_prompt_cache) >= _PROMPT_CACHE_MAX:
+        # FIFO eviction: dicts preserve insertion order
+        _prompt_cache.pop(next(iter(_prompt_cache)), None)
+    _prompt_cache[key] = prompt
+    return prompt
+
+
+def get_system_prompt_blocks(
+    video_metadata: str | None = None,
+    include_full_registry: bool = True,
+    connected_inputs: str = "",
+) -> list[dict[str, Any]]:
+    """Build the system prompt as a list of Anthropic-style text blocks.
+
+    Emits one block per segment (one per category for the full registry).
+    Provider caches match on prefixes and cap the number of breakpoints
+    per request, so a single ``cache_control`` marker is placed on the
+    last block of the leading cacheable run.  OpenAI-style callers can
+    simply use :func:`get_system_prompt` instead.
+
+    Args:
+        video_metadata: Optional video analysis string.
+        include_full_registry: Whether to include full skill descriptions.
+        connected_inputs: Summary of connected inputs.
+
+    Returns:
+        List of ``{"type": "text", "text": ...}`` content blocks.
+    """
+    blocks: list[dict[str, Any]] = []
+    cache_marked = False
+    for text, cacheable in iter_system_prompt_segments(
+        video_metadata=video_metadata,
+        include_full_registry=include_full_registry,
+        connected_inputs=connected_inputs,
+    ):
+        if not cacheable and not cache_marked and blocks:
+            blocks[-1]["cache_control"] = {"type": "ephemeral"}
+            cache_marked = True
+        blocks.append({"type": "text", "text": text})
 
-AGENTIC_SYSTEM_PROMPT = """You are FFMPEGA, an expert video editing agent. You interpret natural language video editing requests and translate them into precise FFMPEG operations using a skill-based pipeline system.
+    if not cache_marked and blocks:
+        blocks[-1]["cache_control"] = {"type": "ephemeral"}
+    return blocks
+
+
+_AGENTIC_SYSTEM_PROMPT_SOURCE = """You are FFMPEGA, an expert video editing agent. You interpret natural language video editing requests and translate them into precise FFMPEG operations using a skill-based pipeline system.
 
 ## Your Tools
 1. **search_skills**: Search for skills by keyword. USE THIS FIRST for EVERY request.
@@ -416,48 +598,48 @@ AGENTIC_SYSTEM_PROMPT = """You are FFMPEGA, an expert video editing agent. You i
 Tool calls: search_skills("slow motion") → get_skill_details("speed")
 Result:
 ```json
-{{"interpretation": "Apply slow motion effect", "pipeline": [{{"skill": "speed", "params": {{"factor": 0.25}}}}], "warnings": [], "estimated_changes": "Video plays at quarter speed"}}
+{"interpretation": "Apply slow motion effect", "pipeline": [{"skill": "speed", "params": {"factor": 0.25}}], "warnings": [], "estimated_changes": "Video plays at quarter speed"}
 ```
 
 ### Example 2: "Make it all blue"
 Tool calls: search_skills("blue") → get_skill_details("colorbalance")
 Result:
 ```json
-{{"interpretation": "Apply strong blue color tint", "pipeline": [{{"skill": "colorbalance", "params": {{"rs": -0.5, "gs": -0.3, "bs": 0.7, "rm": -0.4, "gm": -0.2, "bm": 0.6}}}}], "warnings": [], "estimated_changes": "Strong blue color cast applied"}}
+{"interpretation": "Apply strong blue color tint", "pipeline": [{"skill": "colorbalance", "params": {"rs": -0.5, "gs": -0.3, "bs": 0.7, "rm": -0.4, "gm": -0.2, "bm": 0.6}}], "warnings": [], "estimated_changes": "Strong blue color cast applied"}
 ```
 
 ### Example 3: "Add cinematic black bars and fade in"
 Tool calls: search_skills("cinematic") → get_skill_details("letterbox") → search_skills("fade") → get_skill_details("fade")
 Result:
 ```json
-{{"interpretation": "Add letterbox bars and fade-in effect", "pipeline": [{{"skill": "letterbox", "params": {{"ratio": "2.35:1", "color": "black"}}}}, {{"skill": "fade", "params": {{"type": "in", "duration": 2}}}}], "warnings": [], "estimated_changes": "Cinematic widescreen with 2s fade-in"}}
+{"interpretation": "Add letterbox bars and fade-in effect", "pipeline": [{"skill": "letterbox", "params": {"ratio": "2.35:1", "color": "black"}}, {"skill": "fade", "params": {"type": "in", "duration": 2}}], "warnings": [], "estimated_changes": "Cinematic widescreen with 2s fade-in"}
 ```
 
 ### Example 6: "Add black letterbox bars"
 Tool calls: search_skills("letterbox bars") → get_skill_details("letterbox")
 Result:
 ```json
-{{"interpretation": "Add black letterbox bars", "pipeline": [{{"skill": "letterbox", "params": {{"ratio": "2.35:1", "color": "black"}}}}], "warnings": [], "estimated_changes": "Black bars added at top and bottom for widescreen look"}}
+{"interpretation": "Add black letterbox bars", "pipeline": [{"skill": "letterbox", "params": {"ratio": "2.35:1", "color": "black"}}], "warnings": [], "estimated_changes": "Black bars added at top and bottom for widescreen look"}
 ```
 
 ### Example 4: "Boost the bass"
 Tool calls: search_skills("bass") → get_skill_details("bass")
 Result:
 ```json
-{{"interpretation": "Boost bass frequencies in the audio", "pipeline": [{{"skill": "bass", "params": {{"gain": 10}}}}], "warnings": [], "estimated_changes": "Bass frequencies will be louder"}}
+{"interpretation": "Boost bass frequencies in the audio", "pipeline": [{"skill": "bass", "params": {"gain": 10}}], "warnings": [], "estimated_changes": "Bass frequencies will be louder"}
 ```
 
 ### Example 5: "Add a wipe transition from the left"
 Tool calls: search_skills("wipe") → get_skill_details("wipe")
 Result:
 ```json
-{{"interpretation": "Add left-to-right wipe reveal transition", "pipeline": [{{"skill": "wipe", "params": {{"direction": "left", "duration": 1.5}}}}], "warnings": [], "estimated_changes": "Video revealed with a left-to-right wipe from black"}}
+{"interpretation": "Add left-to-right wipe reveal transition", "pipeline": [{"skill": "wipe", "params": {"direction": "left", "duration": 1.5}}], "warnings": [], "estimated_changes": "Video revealed with a left-to-right wipe from black"}
 ```
 
 ## Output Format
 Respond with valid JSON:
 ```json
-{{"interpretation": "...", "pipeline": [{{"skill": "name", "params": {{}}}}], "warnings": [], "estimated_changes": "..."}}
+{"interpretation": "...", "pipeline": [{"skill": "name", "params": {}}], "warnings": [], "estimated_changes": "..."}
 ```
 
 ## DO NOT
@@ -489,9 +671,9 @@ Frames from extract_frames are automatically embedded as images.
 results = search_skills("cinematic color")
 top = results["matches"][0]["name"]
 details = get_skill_details(top)
-params = {{"intensity": "medium"}}
+params = {"intensity": "medium"}
 pipeline = build_pipeline(
-    [{{"name": top, "params": params}}],
+    [{"name": top, "params": params}],
     "/tmp/in.mp4", "/tmp/out.mp4"
 )
 print(json.dumps(pipeline))
@@ -502,10 +684,10 @@ print(json.dumps(pipeline))
 > **When NOT to use**: Simple 1-2 tool requests.
 
 ## Input Video
-{video_metadata}
+$video_metadata
 
 ## Connected Inputs
-{connected_inputs}
+$connected_inputs
 
 When the user references specific inputs by name (audio_a, audio_b, etc.), include
 "audio_source" in your response JSON. Valid values: "audio_a", "audio_b", etc., or "mix".
@@ -519,7 +701,7 @@ When audio is connected, default to "loop" unless the user specifies otherwise.
 
 
 # PTC-first variant: when ptc_mode=="on", replace the PTC section
-PTC_FIRST_SECTION = """\
+_PTC_FIRST_SECTION_SOURCE = """\
 ## MANDATORY: Programmatic Tool Calling (execute_code)
 You MUST use **execute_code** for ALL requests. Write a single Python script that:
 1. Searches for relevant skills with search_skills()
@@ -549,9 +731,9 @@ details = get_skill_details(top)
 info = analyze_video("/tmp/input.mp4")
 
 # Build the pipeline with discovered skills
-params = {{"intensity": "medium"}}
+params = {"intensity": "medium"}
 pipeline = build_pipeline(
-    [{{"name": top, "params": params}}],
+    [{"name": top, "params": params}],
     "/tmp/in.mp4", "/tmp/out.mp4"
 )
 print(json.dumps(pipeline))
@@ -561,6 +743,31 @@ print(json.dumps(pipeline))
 > execute_code script. The only tool you should call is execute_code.
 """
 
+_PTC_SECTION_RE = re.compile(
+    r"## Programmatic Tool Calling \(execute_code\).*?(?=## Input Video)",
+    flags=re.DOTALL,
+)
+
+_AGENTIC_PTC_VARIANTS = {
+    # Replace the auto PTC section with the mandatory PTC section
+    "on": _PTC_SECTION_RE.sub(
+        lambda _m: _PTC_FIRST_SECTION_SOURCE + "\n", _AGENTIC_SYSTEM_PROMPT_SOURCE,
+    ),
+    # Strip the PTC section entirely
+    "off": _PTC_SECTION_RE.sub("", _AGENTIC_SYSTEM_PROMPT_SOURCE),
+    # Template as-is (the LLM chooses)
+    "auto": _AGENTIC_SYSTEM_PROMPT_SOURCE,
+}
+
+# Pre-split agentic prompt variants keyed by ptc_mode
+_AGENTIC_PROMPT_SEGMENTS = {
+    mode: _split_template(template)
+    for mode, template in _AGENTIC_PTC_VARIANTS.items()
+}
+
+AGENTIC_SYSTEM_PROMPT = _to_format_syntax(_AGENTIC_SYSTEM_PROMPT_SOURCE)
+PTC_FIRST_SECTION = _to_format_syntax(_PTC_FIRST_SECTION_SOURCE)
+
 
 def get_agentic_system_prompt(
     video_metadata: Optional[str] = None,
@@ -580,31 +787,15 @@ def get_agentic_system_prompt(
     Returns:
         Formatted system prompt string.
     """
-    video_info = video_metadata or "No video information available - assume standard video input"
-    inputs_info = connected_inputs or "No extra inputs connected"
-
-    prompt = AGENTIC_SYSTEM_PROMPT
-
-    if ptc_mode == "on":
-        # Replace the auto PTC section with the mandatory PTC section
-        import re
-        prompt = re.sub(
-            r"## Programmatic Tool Calling \(execute_code\).*?(?=## Input Video)",
-            PTC_FIRST_SECTION + "\n",
-            prompt,
-            flags=re.DOTALL,
-        )
-    elif ptc_mode == "off":
-        # Strip the PTC section entirely
-        import re
-        prompt = re.sub(
-            r"## Programmatic Tool Calling \(execute_code\).*?(?=## Input Video)",
-            "",
-            prompt,
-            flags=re.DOTALL,
-        )
+    video_info = video_metadata or _NO_VIDEO_INFO
+    inputs_info = connected_inputs or _NO_CONNECTED_INPUTS
+
+    segments = _AGENTIC_PROMPT_SEGMENTS.get(
+        ptc_mode, _AGENTIC_PROMPT_SEGMENTS["auto"],
+    )
 
-    return prompt.format(
+    return _render_segments(
+        segments,
         video_metadata=video_info,
         connected_inputs=inputs_info,
     )
@@ -612,16 +803,16 @@ def get_agentic_system_prompt(
 
 # ── Output verification prompt ──────────────────────────────────── #
 
-VERIFICATION_PROMPT = """You are reviewing the output of a video editing operation.
+_VERIFICATION_PROMPT_SOURCE = """You are reviewing the output of a video editing operation.
 
 ## Original User Request
-"{prompt}"
+"$prompt"
 
 ## Pipeline That Was Applied
-{pipeline_summary}
+$pipeline_summary
 
 ## Output Analysis
-{output_data}
+$output_data
 
 ## Your Task
 Assess whether the output matches the user's original intent.
@@ -641,10 +832,13 @@ Assess whether the output matches the user's original intent.
 
 - If the output looks correct and the edit was applied as requested, respond with EXACTLY: PASS
 - If the output needs correction, respond with ONLY a corrected pipeline JSON in this format:
-{{"interpretation": "...", "pipeline": [{{"skill": "skill_name", "params": {{}}}}], "warnings": []}}
+{"interpretation": "...", "pipeline": [{"skill": "skill_name", "params": {}}], "warnings": []}
 
 Do NOT explain your reasoning. Respond with either PASS or corrected JSON only."""
 
+_VERIFICATION_PROMPT_SEGMENTS = _split_template(_VERIFICATION_PROMPT_SOURCE)
+VERIFICATION_PROMPT = _to_format_syntax(_VERIFICATION_PROMPT_SOURCE)
+
 
 def get_verification_prompt(
     prompt: str,
@@ -661,7 +855,8 @@ def get_verification_prompt(
     Returns:
         Formatted verification prompt string.
     """
-    return VERIFICATION_PROMPT.format(
+    return _render_segments(
+        _VERIFICATION_PROMPT_SEGMENTS,
         prompt=prompt,
         pipeline_summary=pipeline_summary,
         output_data=output_data,
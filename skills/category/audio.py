@@ -5,11 +5,13 @@ from ..registry import SkillRegistry, Skill, SkillParameter, SkillCategory, Para
 
 def register_skills(registry: SkillRegistry) -> None:
     """Register audio skills with the registry."""
+    AUDIO = SkillCategory.AUDIO
+    skills: list[Skill] = []
 
     # Volume skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="volume",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Adjust audio volume level",
         parameters=[
             SkillParameter(
@@ -22,30 +24,40 @@ def register_skills(registry: SkillRegistry) -> None:
                 max_value=10.0,
             ),
         ],
-        examples=[
+        examples=(
             "volume:level=1.5 - 50% louder",
             "volume:level=0.5 - 50% quieter",
             "volume:level=2.0 - Double volume",
-        ],
-        tags=["loud", "quiet", "gain", "level"],
+        ),
+        tags=("loud", "quiet", "gain", "level"),
     ))
 
     # Normalize skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="normalize",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Normalize audio levels for consistent volume",
-        parameters=[],
-        examples=[
-            "normalize - Automatically adjust audio to standard levels",
+        parameters=[
+            SkillParameter(
+                name="engine",
+                type=ParameterType.CHOICE,
+                description="loudnorm_1pass = dynamic single pass (fastest), loudnorm_2pass = measure then linear loudnorm (most accurate), static_gain = measure then apply one volume gain",
+                required=False,
+                default="loudnorm_1pass",
+                choices=("loudnorm_1pass", "loudnorm_2pass", "static_gain"),
+            ),
         ],
-        tags=["loudness", "level", "standard"],
+        examples=(
+            "normalize - Automatically adjust audio to standard levels",
+            "normalize:engine=static_gain - Measure once, apply a single gain",
+        ),
+        tags=("loudness", "level", "standard"),
     ))
 
     # Fade audio skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="fade_audio",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Add audio fade in/out",
         parameters=[
             SkillParameter(
@@ -54,7 +66,7 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="Fade type",
                 required=False,
                 default="in",
-                choices=["in", "out"],
+                choices=("in", "out"),
             ),
             SkillParameter(
                 name="start",
@@ -71,29 +83,29 @@ def register_skills(registry: SkillRegistry) -> None:
                 default=1,
             ),
         ],
-        examples=[
+        examples=(
             "fade_audio:type=in,duration=2 - 2 second audio fade in",
             "fade_audio:type=out,start=55,duration=5 - Fade out last 5 seconds",
-        ],
-        tags=["transition", "silence"],
+        ),
+        tags=("transition", "silence"),
     ))
 
     # Remove audio skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="remove_audio",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Strip audio track from video",
         parameters=[],
-        examples=[
+        examples=(
             "remove_audio - Remove all audio, output video only",
-        ],
-        tags=["mute", "silent", "strip"],
+        ),
+        tags=("mute", "silent", "strip"),
     ))
 
     # Extract audio skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="extract_audio",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Export audio track only",
         parameters=[
             SkillParameter(
@@ -102,20 +114,21 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="Output audio format",
                 required=False,
                 default="mp3",
-                choices=["mp3", "aac", "wav", "flac", "ogg"],
+                choices=("mp3", "aac", "wav", "flac", "ogg"),
             ),
         ],
-        examples=[
+        examples=(
             "extract_audio:format=mp3 - Extract audio as MP3",
             "extract_audio:format=wav - Extract audio as WAV",
-        ],
-        tags=["export", "rip", "audio only"],
+        ),
+        tags=("export", "rip", "audio only"),
+        batch_parallel=4,
     ))
 
     # Audio pitch skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="pitch",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Change audio pitch without affecting speed",
         parameters=[
             SkillParameter(
@@ -128,51 +141,17 @@ def register_skills(registry: SkillRegistry) -> None:
                 max_value=12,
             ),
         ],
-        ffmpeg_template="asetrate=44100*2^({semitones}/12),aresample=44100",
-        examples=[
+        examples=(
             "pitch:semitones=2 - Higher pitch",
             "pitch:semitones=-3 - Lower pitch",
-        ],
-        tags=["tone", "frequency"],
-    ))
-
-    # Audio echo skill
-    registry.register(Skill(
-        name="echo",
-        category=SkillCategory.AUDIO,
-        description="Add echo effect to audio",
-        parameters=[
-            SkillParameter(
-                name="delay",
-                type=ParameterType.INT,
-                description="Echo delay in milliseconds",
-                required=False,
-                default=500,
-                min_value=50,
-                max_value=2000,
-            ),
-            SkillParameter(
-                name="decay",
-                type=ParameterType.FLOAT,
-                description="Echo decay (0.0-1.0)",
-                required=False,
-                default=0.5,
-                min_value=0.0,
-                max_value=1.0,
-            ),
-        ],
-        ffmpeg_template="aecho=0.8:0.9:{delay}:{decay}",
-        examples=[
-            "echo:delay=300,decay=0.4 - Short echo",
-            "echo:delay=1000,decay=0.6 - Long reverberant echo",
-        ],
-        tags=["reverb", "effect"],
+        ),
+        tags=("tone", "frequency"),
     ))
 
     # Audio bass boost skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="bass",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Boost or reduce bass frequencies",
         parameters=[
             SkillParameter(
@@ -195,17 +174,17 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="bass=g={gain}:f={frequency}",
-        examples=[
+        examples=(
             "bass:gain=6 - Boost bass",
             "bass:gain=-3 - Reduce bass",
-        ],
-        tags=["eq", "low", "boost"],
+        ),
+        tags=("eq", "low", "boost"),
     ))
 
     # Audio treble skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="treble",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Boost or reduce treble frequencies",
         parameters=[
             SkillParameter(
@@ -228,17 +207,17 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="treble=g={gain}:f={frequency}",
-        examples=[
+        examples=(
             "treble:gain=4 - Boost highs",
             "treble:gain=-2 - Reduce highs",
-        ],
-        tags=["eq", "high", "bright"],
+        ),
+        tags=("eq", "high", "bright"),
     ))
 
     # Audio compressor skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="compress_audio",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Apply dynamic range compression",
         parameters=[
             SkillParameter(
@@ -261,17 +240,17 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="acompressor=threshold={threshold}dB:ratio={ratio}",
-        examples=[
+        examples=(
             "compress_audio:threshold=-15,ratio=3 - Light compression",
             "compress_audio:threshold=-25,ratio=8 - Heavy compression",
-        ],
-        tags=["dynamics", "limiter"],
+        ),
+        tags=("dynamics", "limiter"),
     ))
 
     # Echo/reverb skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="echo",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Add echo/reverb effect to audio",
         parameters=[
             SkillParameter(
@@ -294,18 +273,18 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="aecho=0.8:0.88:{delay}:{decay}",
-        examples=[
+        examples=(
             "echo - Standard echo",
             "echo:delay=1000,decay=0.3 - Long subtle echo",
             "echo:delay=200,decay=0.7 - Short strong echo",
-        ],
-        tags=["reverb", "echo", "delay", "space", "room"],
+        ),
+        tags=("reverb", "echo", "delay", "space", "room"),
     ))
 
     # Equalizer skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="equalizer",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Apply equalizer band adjustment",
         parameters=[
             SkillParameter(
@@ -337,43 +316,43 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="equalizer=f={freq}:width_type=h:width={width}:g={gain}",
-        examples=[
+        examples=(
             "equalizer:freq=100,gain=6 - Boost bass frequencies",
             "equalizer:freq=8000,gain=-3 - Reduce treble",
-        ],
-        tags=["eq", "frequency", "band", "boost", "cut"],
+        ),
+        tags=("eq", "frequency", "band", "boost", "cut"),
     ))
 
     # Stereo swap skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="stereo_swap",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Swap left and right audio channels",
         parameters=[],
         ffmpeg_template="channelmap=1|0",
-        examples=[
+        examples=(
             "stereo_swap - Swap left and right channels",
-        ],
-        tags=["stereo", "channels", "swap", "left", "right"],
+        ),
+        tags=("stereo", "channels", "swap", "left", "right"),
     ))
 
     # Mono conversion skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="mono",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Convert audio to mono (single channel)",
         parameters=[],
         ffmpeg_template="pan=mono|c0=0.5*c0+0.5*c1",
-        examples=[
+        examples=(
             "mono - Convert stereo to mono",
-        ],
-        tags=["mono", "single", "channel", "downmix"],
+        ),
+        tags=("mono", "single", "channel", "downmix"),
     ))
 
     # Audio speed skill (audio only, no video change)
-    registry.register(Skill(
+    skills.append(Skill(
         name="audio_speed",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Change audio speed/tempo without affecting video",
         parameters=[
             SkillParameter(
@@ -387,17 +366,17 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="atempo={factor}",
-        examples=[
+        examples=(
             "audio_speed:factor=1.5 - Speed up audio 1.5x",
             "audio_speed:factor=0.75 - Slow down audio",
-        ],
-        tags=["tempo", "speed", "fast", "slow", "pitch"],
+        ),
+        tags=("tempo", "speed", "fast", "slow", "pitch"),
     ))
 
     # Chorus effect skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="chorus",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Add chorus effect to audio (thickens/enriches sound)",
         parameters=[
             SkillParameter(
@@ -411,17 +390,17 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="chorus=0.7:0.9:55:{depth}:0.25:2",
-        examples=[
+        examples=(
             "chorus - Standard chorus effect",
             "chorus:depth=0.8 - Deep chorus",
-        ],
-        tags=["chorus", "thick", "rich", "vocal", "wide"],
+        ),
+        tags=("chorus", "thick", "rich", "vocal", "wide"),
     ))
 
     # Flanger effect skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="flanger",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Add flanger effect to audio (sweeping jet sound)",
         parameters=[
             SkillParameter(
@@ -444,17 +423,17 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="flanger=speed={speed}:depth={depth}",
-        examples=[
+        examples=(
             "flanger - Standard flanger",
             "flanger:speed=1.0,depth=5 - Intense flanger",
-        ],
-        tags=["flanger", "sweep", "jet", "modulation", "psychedelic"],
+        ),
+        tags=("flanger", "sweep", "jet", "modulation", "psychedelic"),
     ))
 
     # Low pass filter skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="lowpass",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Apply low pass filter (removes high frequencies, muffled sound)",
         parameters=[
             SkillParameter(
@@ -468,18 +447,18 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="lowpass=f={freq}",
-        examples=[
+        examples=(
             "lowpass - Muffle audio (1kHz cutoff)",
             "lowpass:freq=500 - Very muffled (behind wall effect)",
             "lowpass:freq=3000 - Slight warmth",
-        ],
-        tags=["filter", "muffle", "warm", "telephone", "lo-fi"],
+        ),
+        tags=("filter", "muffle", "warm", "telephone", "lo-fi"),
     ))
 
     # High pass filter skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="highpass",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Apply high pass filter (removes low frequencies, thin sound)",
         parameters=[
             SkillParameter(
@@ -493,31 +472,31 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="highpass=f={freq}",
-        examples=[
+        examples=(
             "highpass - Remove rumble (300Hz cutoff)",
             "highpass:freq=1000 - Tinny/telephone effect",
             "highpass:freq=80 - Subtle rumble removal",
-        ],
-        tags=["filter", "thin", "rumble", "clean", "telephone"],
+        ),
+        tags=("filter", "thin", "rumble", "clean", "telephone"),
     ))
 
     # Audio reverse skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="audio_reverse",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Reverse the audio track",
         parameters=[],
         ffmpeg_template="areverse",
-        examples=[
+        examples=(
             "audio_reverse - Reverse audio playback",
-        ],
-        tags=["reverse", "backwards", "creepy"],
+        ),
+        tags=("reverse", "backwards", "creepy"),
     ))
 
     # Noise reduction — FFT-based audio denoising
-    registry.register(Skill(
+    skills.append(Skill(
         name="noise_reduction",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Remove background noise from audio (hiss, hum, ambient noise)",
         parameters=[
             SkillParameter(
@@ -541,18 +520,18 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="afftdn=nf={floor}:nr={amount}:nt=w",
-        examples=[
+        examples=(
             "noise_reduction - Standard background noise removal",
             "noise_reduction:floor=-40,amount=30 - Aggressive noise removal",
             "noise_reduction:floor=-25,amount=6 - Gentle cleanup",
-        ],
-        tags=["noise", "denoise", "clean", "hiss", "hum", "background", "fft"],
+        ),
+        tags=("noise", "denoise", "clean", "hiss", "hum", "background", "fft"),
     ))
 
     # Audio crossfade
-    registry.register(Skill(
+    skills.append(Skill(
         name="audio_crossfade",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Smooth audio crossfade transition between clips",
         parameters=[
             SkillParameter(
@@ -570,34 +549,34 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="Fade curve shape",
                 required=False,
                 default="tri",
-                choices=["tri", "exp", "log", "par", "qua", "squ", "nofade"],
+                choices=("tri", "exp", "log", "par", "qua", "squ", "nofade"),
             ),
         ],
         # acrossfade requires two audio inputs; handled in composer.py via filter_complex
-        examples=[
+        examples=(
             "audio_crossfade - 2 second triangle crossfade",
             "audio_crossfade:duration=5,curve=exp - 5s exponential crossfade",
-        ],
-        tags=["crossfade", "transition", "blend", "smooth", "mix"],
+        ),
+        tags=("crossfade", "transition", "blend", "smooth", "mix"),
     ))
 
     # Replace audio — swap the audio track
-    registry.register(Skill(
+    skills.append(Skill(
         name="replace_audio",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Replace video's audio with audio from another file (uses extra_inputs)",
         parameters=[],
         # replace_audio needs duplicate -map flags; handled in composer.py to avoid dedup
-        examples=[
+        examples=(
             "replace_audio - Replace audio track with second input's audio",
-        ],
-        tags=["swap", "replace", "dub", "music", "voiceover"],
+        ),
+        tags=("swap", "replace", "dub", "music", "voiceover"),
     ))
 
     # Audio delay — sync offset correction
-    registry.register(Skill(
+    skills.append(Skill(
         name="audio_delay",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Delay audio by a fixed amount (fix audio/video sync issues)",
         parameters=[
             SkillParameter(
@@ -611,17 +590,17 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="adelay={ms}|{ms}",
-        examples=[
+        examples=(
             "audio_delay:ms=100 - Delay audio by 100ms",
             "audio_delay:ms=500 - Delay audio by half a second",
-        ],
-        tags=["delay", "sync", "offset", "lip", "latency", "fix"],
+        ),
+        tags=("delay", "sync", "offset", "lip", "latency", "fix"),
     ))
 
     # Ducking — lower music volume when voice is present
-    registry.register(Skill(
+    skills.append(Skill(
         name="ducking",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Auto-duck music volume when voice/speech is detected (sidechain compression)",
         parameters=[
             SkillParameter(
@@ -653,17 +632,17 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="compand=attacks=0.05:decays={release}:points=-80/-80|{threshold}/{threshold}|0/-{ratio}|20/-{ratio}",
-        examples=[
+        examples=(
             "ducking - Auto-lower music during speech",
             "ducking:threshold=-25,ratio=8 - Aggressive ducking",
-        ],
-        tags=["duck", "sidechain", "compress", "voice", "speech", "music", "podcast"],
+        ),
+        tags=("duck", "sidechain", "compress", "voice", "speech", "music", "podcast"),
     ))
 
     # Dereverb — remove room echo / reverb
-    registry.register(Skill(
+    skills.append(Skill(
         name="dereverb",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Reduce room echo and reverb from audio (dry up the sound)",
         parameters=[
             SkillParameter(
@@ -677,17 +656,17 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="highpass=f=80,lowpass=f=12000,afftdn=nf=-20:nr={amount}:nt=w",
-        examples=[
+        examples=(
             "dereverb - Standard room echo removal",
             "dereverb:amount=30 - Aggressive reverb removal",
-        ],
-        tags=["reverb", "echo", "room", "dry", "clean", "voice"],
+        ),
+        tags=("reverb", "echo", "room", "dry", "clean", "voice"),
     ))
 
     # Split audio — isolate left/right channel
-    registry.register(Skill(
+    skills.append(Skill(
         name="split_audio",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Extract a specific audio channel (left or right) from stereo audio",
         parameters=[
             SkillParameter(
@@ -696,21 +675,21 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="Which channel to extract",
                 required=False,
                 default="FL",
-                choices=["FL", "FR"],
+                choices=("FL", "FR"),
             ),
         ],
         ffmpeg_template="pan=mono|c0={channel}",
-        examples=[
+        examples=(
             "split_audio - Extract left channel",
             "split_audio:channel=FR - Extract right channel",
-        ],
-        tags=["channel", "mono", "left", "right", "stereo", "isolate", "split"],
+        ),
+        tags=("channel", "mono", "left", "right", "stereo", "isolate", "split"),
     ))
 
     # Audio normalize loudness — EBU R128 standard
-    registry.register(Skill(
+    skills.append(Skill(
         name="audio_normalize_loudness",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description="Normalize audio loudness to broadcast standard (EBU R128 / -14 LUFS for streaming)",
         parameters=[
             SkillParameter(
@@ -733,17 +712,17 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="loudnorm=I={target}:TP={tp}:LRA=11",
-        examples=[
+        examples=(
             "audio_normalize_loudness - Normalize to -14 LUFS (streaming standard)",
             "audio_normalize_loudness:target=-24 - Broadcast standard (-24 LUFS)",
-        ],
-        tags=["loudness", "lufs", "ebu", "r128", "broadcast", "normalize", "streaming"],
+        ),
+        tags=("loudness", "lufs", "ebu", "r128", "broadcast", "normalize", "streaming"),
     ))
 
     # Generate audio — AI-powered audio synthesis (MMAudio)
-    registry.register(Skill(
+    skills.append(Skill(
         name="generate_audio",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description=(
             "AI-generate synchronized audio/sound effects from video content "
             "or text description using MMAudio. Analyzes video frames to "
@@ -773,7 +752,7 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="How to combine generated audio with existing audio",
                 required=False,
                 default="replace",
-                choices=["replace", "mix"],
+                choices=("replace", "mix"),
             ),
             SkillParameter(
                 name="seed",
@@ -794,23 +773,23 @@ def register_skills(registry: SkillRegistry) -> None:
                 max_value=15.0,
             ),
         ],
-        examples=[
+        examples=(
             "generate_audio - Generate matching audio for the video",
             "generate_audio:prompt=ocean waves crashing - Generate ocean sounds",
             "generate_audio:prompt=footsteps on gravel,mode=mix - Add footstep foley, mixed with original",
             "generate_audio:mode=replace - Replace audio with AI-generated audio",
-        ],
-        tags=[
+        ),
+        tags=(
             "generate", "synthesize", "foley", "sound", "effects", "ai",
             "mmaudio", "v2a", "video_to_audio", "sound_effects", "sfx",
             "non_commercial", "cc_by_nc",
-        ],
+        ),
     ))
 
     # Lip sync — AI-powered lip synchronization (MuseTalk)
-    registry.register(Skill(
+    skills.append(Skill(
         name="lip_sync",
-        category=SkillCategory.AUDIO,
+        category=AUDIO,
         description=(
             "AI lip sync: synchronize a face's lip movements to match "
             "provided audio using MuseTalk. Works with both video and image "
@@ -843,14 +822,15 @@ def register_skills(registry: SkillRegistry) -> None:
                 max_value=32,
             ),
         ],
-        examples=[
+        examples=(
             "lip_sync:audio_path=/path/to/speech.wav - Sync lips to speech audio",
             "lip_sync:audio_path=/path/to/voice.mp3,face_index=0 - Sync first face only",
             "lip_sync:audio_path=/path/to/audio.wav,batch_size=4 - Lower VRAM usage",
-        ],
-        tags=[
+        ),
+        tags=(
             "lip", "sync", "lipsync", "dub", "dubbing", "talking", "head",
             "face", "voice", "speech", "musetalk", "ai",
-        ],
+        ),
     ))
 
+    registry.register_many(skills)
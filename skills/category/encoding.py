@@ -5,9 +5,10 @@ from ..registry import SkillRegistry, Skill, SkillParameter, SkillCategory, Para
 
 def register_skills(registry: SkillRegistry) -> None:
     """Register encoding skills with the registry."""
+    skills: list[Skill] = []
 
     # Compress skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="compress",
         category=SkillCategory.ENCODING,
         description="Reduce file size through compression",
@@ -18,19 +19,19 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="Compression level",
                 required=False,
                 default="medium",
-                choices=["light", "medium", "heavy"],
+                choices=("light", "medium", "heavy"),
             ),
         ],
-        examples=[
+        examples=(
             "compress:preset=light - Slight compression, good quality",
             "compress:preset=medium - Balanced compression",
             "compress:preset=heavy - Maximum compression, lower quality",
-        ],
-        tags=["size", "small", "reduce", "web"],
+        ),
+        tags=("size", "small", "reduce", "web"),
     ))
 
     # Convert skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="convert",
         category=SkillCategory.ENCODING,
         description="Change video codec",
@@ -41,20 +42,29 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="Target video codec",
                 required=False,
                 default="h264",
-                choices=["h264", "h265", "vp9", "av1", "prores"],
+                choices=("h264", "h265", "vp9", "av1", "prores"),
+            ),
+            SkillParameter(
+                name="encoder",
+                type=ParameterType.CHOICE,
+                description="software = x264/x265 etc.; auto = use a working GPU encoder (NVENC/VideoToolbox) for h264/h265 if present",
+                required=False,
+                default="software",
+                choices=("software", "auto"),
             ),
         ],
-        examples=[
+        examples=(
             "convert:codec=h264 - Convert to H.264 (most compatible)",
+            "convert:codec=h265,encoder=auto - HEVC on the GPU when available",
             "convert:codec=h265 - Convert to HEVC (smaller files)",
             "convert:codec=vp9 - Convert to VP9 (web optimized)",
             "convert:codec=prores - Convert to ProRes (editing)",
-        ],
-        tags=["codec", "transcode", "format"],
+        ),
+        tags=("codec", "transcode", "format"),
     ))
 
     # Bitrate skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="bitrate",
         category=SkillCategory.ENCODING,
         description="Set specific bitrate for encoding",
@@ -72,15 +82,15 @@ def register_skills(registry: SkillRegistry) -> None:
                 required=False,
             ),
         ],
-        examples=[
+        examples=(
             "bitrate:video=5M - 5 Mbps video",
             "bitrate:video=2M,audio=128k - 2 Mbps video, 128k audio",
-        ],
-        tags=["quality", "size", "rate"],
+        ),
+        tags=("quality", "size", "rate"),
     ))
 
     # Quality skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="quality",
         category=SkillCategory.ENCODING,
         description="Set quality level using CRF",
@@ -100,21 +110,21 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="Encoding speed preset",
                 required=False,
                 default="medium",
-                choices=["ultrafast", "superfast", "veryfast", "faster",
-                         "fast", "medium", "slow", "slower", "veryslow"],
+                choices=("ultrafast", "superfast", "veryfast", "faster",
+                         "fast", "medium", "slow", "slower", "veryslow"),
             ),
         ],
-        examples=[
+        examples=(
             "quality:crf=18 - High quality",
             "quality:crf=23 - Standard quality",
             "quality:crf=28 - Lower quality, smaller file",
             "quality:crf=18,preset=slow - High quality, better compression",
-        ],
-        tags=["crf", "level"],
+        ),
+        tags=("crf", "level"),
     ))
 
     # Container skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="container",
         category=SkillCategory.ENCODING,
         description="Change container format",
@@ -125,20 +135,20 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="Container format",
                 required=False,
                 default="mp4",
-                choices=["mp4", "mkv", "webm", "mov", "avi", "gif"],
+                choices=("mp4", "mkv", "webm", "mov", "avi", "gif"),
             ),
         ],
-        examples=[
+        examples=(
             "container:format=mp4 - MP4 (most compatible)",
             "container:format=mkv - MKV (feature-rich)",
             "container:format=webm - WebM (web optimized)",
             "container:format=gif - Animated GIF",
-        ],
-        tags=["format", "extension", "wrapper"],
+        ),
+        tags=("format", "extension", "wrapper"),
     ))
 
     # Web optimize skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="web_optimize",
         category=SkillCategory.ENCODING,
         description="Optimize video for web streaming",
@@ -152,14 +162,14 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="-movflags +faststart",
-        examples=[
+        examples=(
             "web_optimize - Optimize for web playback",
-        ],
-        tags=["streaming", "faststart", "moov"],
+        ),
+        tags=("streaming", "faststart", "moov"),
     ))
 
     # Two-pass encoding skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="two_pass",
         category=SkillCategory.ENCODING,
         description="Enable two-pass encoding for better quality at target bitrate",
@@ -171,14 +181,14 @@ def register_skills(registry: SkillRegistry) -> None:
                 required=True,
             ),
         ],
-        examples=[
+        examples=(
             "two_pass:target_bitrate=4M - Two-pass at 4 Mbps",
-        ],
-        tags=["quality", "bitrate", "vbr"],
+        ),
+        tags=("quality", "bitrate", "vbr"),
     ))
 
     # Audio codec skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="audio_codec",
         category=SkillCategory.ENCODING,
         description="Set audio codec and quality",
@@ -189,7 +199,7 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="Audio codec",
                 required=False,
                 default="aac",
-                choices=["aac", "mp3", "opus", "flac", "copy"],
+                choices=("aac", "mp3", "opus", "flac", "copy"),
             ),
             SkillParameter(
                 name="bitrate",
@@ -199,15 +209,15 @@ def register_skills(registry: SkillRegistry) -> None:
                 default="128k",
             ),
         ],
-        examples=[
+        examples=(
             "audio_codec:codec=aac,bitrate=192k - AAC at 192kbps",
             "audio_codec:codec=copy - Copy audio without re-encoding",
-        ],
-        tags=["audio", "format", "quality"],
+        ),
+        tags=("audio", "format", "quality"),
     ))
 
     # Pixel format skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="pixel_format",
         category=SkillCategory.ENCODING,
         description="Set output pixel format",
@@ -218,19 +228,19 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="Pixel format",
                 required=False,
                 default="yuv420p",
-                choices=["yuv420p", "yuv422p", "yuv444p", "rgb24"],
+                choices=("yuv420p", "yuv422p", "yuv444p", "rgb24"),
             ),
         ],
         ffmpeg_template="-pix_fmt {format}",
-        examples=[
+        examples=(
             "pixel_format:format=yuv420p - Standard format (most compatible)",
             "pixel_format:format=yuv444p - Higher quality chroma",
-        ],
-        tags=["color", "chroma", "subsampling"],
+        ),
+        tags=("color", "chroma", "subsampling"),
     ))
 
     # Hardware acceleration skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="hwaccel",
         category=SkillCategory.ENCODING,
         description="Enable hardware acceleration for encoding",
@@ -241,19 +251,28 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="Hardware acceleration type",
                 required=False,
                 default="auto",
-                choices=["auto", "cuda", "vaapi", "qsv", "videotoolbox"],
+                choices=("auto", "cuda", "vaapi", "qsv", "videotoolbox"),
+            ),
+            SkillParameter(
+                name="codec",
+                type=ParameterType.CHOICE,
+                description="Also encode on the GPU (cuda/videotoolbox only; none = GPU decode only)",
+                required=False,
+                default="none",
+                choices=("none", "h264", "h265"),
             ),
         ],
-        examples=[
+        examples=(
             "hwaccel:type=cuda - NVIDIA GPU acceleration",
+            "hwaccel:type=cuda,codec=h265 - NVIDIA decode + NVENC HEVC encode",
             "hwaccel:type=vaapi - Intel/AMD VA-API",
             "hwaccel:type=qsv - Intel Quick Sync",
-        ],
-        tags=["gpu", "fast", "nvidia", "intel", "amd"],
+        ),
+        tags=("gpu", "fast", "nvidia", "intel", "amd"),
     ))
 
     # Audio bitrate — independent audio bitrate control
-    registry.register(Skill(
+    skills.append(Skill(
         name="audio_bitrate",
         category=SkillCategory.ENCODING,
         description="Set audio encoding bitrate independently (without changing video codec)",
@@ -270,16 +289,16 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="-b:a {kbps}k",
-        examples=[
+        examples=(
             "audio_bitrate:kbps=320 - High quality audio (320 kbps)",
             "audio_bitrate:kbps=128 - Standard quality (128 kbps)",
             "audio_bitrate:kbps=64 - Low bitrate for voice",
-        ],
-        tags=["audio", "bitrate", "quality", "kbps", "encoding"],
+        ),
+        tags=("audio", "bitrate", "quality", "kbps", "encoding"),
     ))
 
     # Frame rate interpolation — smooth FPS conversion via motion interpolation
-    registry.register(Skill(
+    skills.append(Skill(
         name="frame_rate_interpolation",
         category=SkillCategory.ENCODING,
         description="Change frame rate using motion interpolation (smoother than simple frame drop/dup)",
@@ -299,14 +318,15 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="Interpolation mode (mci = best quality, blend = fast)",
                 required=False,
                 default="mci",
-                choices=["mci", "blend", "dup"],
+                choices=("mci", "blend", "dup"),
             ),
         ],
-        ffmpeg_template="minterpolate=fps={fps}:mi_mode={mode}",
-        examples=[
+        examples=(
             "frame_rate_interpolation - Smooth 60fps interpolation",
             "frame_rate_interpolation:fps=120 - 120fps slow-motion ready",
             "frame_rate_interpolation:fps=24,mode=blend - 24fps with frame blending",
-        ],
-        tags=["fps", "interpolation", "smooth", "motion", "slowmo", "60fps", "120fps"],
+        ),
+        tags=("fps", "interpolation", "smooth", "motion", "slowmo", "60fps", "120fps"),
     ))
+
+    registry.register_many(skills)
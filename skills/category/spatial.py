@@ -5,9 +5,10 @@ from ..registry import SkillRegistry, Skill, SkillParameter, SkillCategory, Para
 
 def register_skills(registry: SkillRegistry) -> None:
     """Register spatial skills with the registry."""
+    skills: list[Skill] = []
 
     # Resize skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="resize",
         category=SkillCategory.SPATIAL,
         description="Change video dimensions",
@@ -27,17 +28,17 @@ def register_skills(registry: SkillRegistry) -> None:
                 default=720,
             ),
         ],
-        examples=[
+        examples=(
             "resize:width=1920,height=1080 - Full HD",
             "resize:width=1280,height=720 - HD 720p",
             "resize:width=-1,height=480 - 480p maintaining aspect",
             "resize:width=640,height=-1 - 640px wide maintaining aspect",
-        ],
-        tags=["scale", "dimensions", "resolution", "size"],
+        ),
+        tags=("scale", "dimensions", "resolution", "size"),
     ))
 
     # Crop skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="crop",
         category=SkillCategory.SPATIAL,
         description="Remove edges of frame",
@@ -69,15 +70,15 @@ def register_skills(registry: SkillRegistry) -> None:
                 default="(in_h-out_h)/2",
             ),
         ],
-        examples=[
+        examples=(
             "crop:width=1280,height=720 - Crop to 1280x720 from center",
             "crop:width=in_w-100,height=in_h-100 - Remove 50px from each edge",
-        ],
-        tags=["cut", "frame", "trim"],
+        ),
+        tags=("cut", "frame", "trim"),
     ))
 
     # Pad skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="pad",
         category=SkillCategory.SPATIAL,
         description="Add borders/letterbox around video",
@@ -116,15 +117,15 @@ def register_skills(registry: SkillRegistry) -> None:
                 default="black",
             ),
         ],
-        examples=[
+        examples=(
             "pad:width=1920,height=1080,color=black - Pad to 1080p with black bars",
             "pad:width=iw,height=iw*16/9 - Add letterbox for 16:9",
-        ],
-        tags=["border", "letterbox", "pillarbox", "bars"],
+        ),
+        tags=("border", "letterbox", "pillarbox", "bars"),
     ))
 
     # Rotate skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="rotate",
         category=SkillCategory.SPATIAL,
         description="Rotate video by angle",
@@ -137,16 +138,16 @@ def register_skills(registry: SkillRegistry) -> None:
                 default=90,
             ),
         ],
-        examples=[
+        examples=(
             "rotate:angle=90 - Rotate 90 degrees clockwise",
             "rotate:angle=-90 - Rotate 90 degrees counter-clockwise",
             "rotate:angle=180 - Rotate 180 degrees",
-        ],
-        tags=["turn", "orientation", "portrait", "landscape"],
+        ),
+        tags=("turn", "orientation", "portrait", "landscape"),
     ))
 
     # Flip skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="flip",
         category=SkillCategory.SPATIAL,
         description="Mirror video horizontally or vertically",
@@ -157,18 +158,18 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="Flip direction",
                 required=False,
                 default="horizontal",
-                choices=["horizontal", "vertical"],
+                choices=("horizontal", "vertical"),
             ),
         ],
-        examples=[
+        examples=(
             "flip:direction=horizontal - Mirror left-right",
             "flip:direction=vertical - Mirror top-bottom",
-        ],
-        tags=["mirror", "reflect"],
+        ),
+        tags=("mirror", "reflect"),
     ))
 
     # Aspect ratio skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="aspect",
         category=SkillCategory.SPATIAL,
         description="Change aspect ratio with letterbox/pillarbox",
@@ -186,7 +187,7 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="How to handle aspect change",
                 required=False,
                 default="pad",
-                choices=["pad", "crop", "stretch"],
+                choices=("pad", "crop", "stretch"),
             ),
             SkillParameter(
                 name="color",
@@ -196,19 +197,19 @@ def register_skills(registry: SkillRegistry) -> None:
                 default="black",
             ),
         ],
-        examples=[
+        examples=(
             "aspect:ratio=16:9,mode=pad - Letterbox to 16:9",
             "aspect:ratio=9:16,mode=crop - Crop to vertical 9:16 for TikTok/Reels",
             "aspect:ratio=1:1,mode=crop - Crop to square for Instagram",
             "aspect:ratio=2.35:1 - Cinematic widescreen",
-        ],
-        tags=["widescreen", "letterbox", "format", "vertical", "portrait",
+        ),
+        tags=("widescreen", "letterbox", "format", "vertical", "portrait",
               "landscape", "tiktok", "reels", "shorts", "instagram", "9:16",
-              "16:9", "4:3", "1:1", "square", "aspect"],
+              "16:9", "4:3", "1:1", "square", "aspect"),
     ))
 
     # Auto crop — detect and remove black borders
-    registry.register(Skill(
+    skills.append(Skill(
         name="auto_crop",
         category=SkillCategory.SPATIAL,
         description="Automatically detect and remove black borders/letterboxing from video",
@@ -224,15 +225,15 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="cropdetect=limit={threshold}:round=2:reset=0,crop",
-        examples=[
+        examples=(
             "auto_crop - Remove black borders automatically",
             "auto_crop:threshold=40 - More aggressive border detection",
-        ],
-        tags=["crop", "black", "borders", "letterbox", "detect", "auto", "remove"],
+        ),
+        tags=("crop", "black", "borders", "letterbox", "detect", "auto", "remove"),
     ))
 
     # Scale 2x — quick upscale with quality algorithm
-    registry.register(Skill(
+    skills.append(Skill(
         name="scale_2x",
         category=SkillCategory.SPATIAL,
         description="Upscale video by 2x (or custom factor) with high-quality scaling algorithm",
@@ -252,13 +253,15 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="Scaling algorithm (lanczos = sharpest, bicubic = smooth)",
                 required=False,
                 default="lanczos",
-                choices=["lanczos", "bicubic", "bilinear", "spline"],
+                choices=("lanczos", "bicubic", "bilinear", "spline"),
             ),
         ],
         ffmpeg_template="scale=iw*{factor}:ih*{factor}:flags={algorithm}",
-        examples=[
+        examples=(
             "scale_2x - Double resolution with Lanczos",
             "scale_2x:factor=4,algorithm=bicubic - 4x upscale with bicubic",
-        ],
-        tags=["upscale", "enlarge", "double", "super", "resolution", "enhance", "2x", "4x"],
+        ),
+        tags=("upscale", "enlarge", "double", "super", "resolution", "enhance", "2x", "4x"),
     ))
+
+    registry.register_many(skills)
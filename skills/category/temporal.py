@@ -5,9 +5,10 @@ from ..registry import SkillRegistry, Skill, SkillParameter, SkillCategory, Para
 
 def register_skills(registry: SkillRegistry) -> None:
     """Register temporal skills with the registry."""
+    skills: list[Skill] = []
 
     # Trim skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="trim",
         category=SkillCategory.TEMPORAL,
         description="Remove portions of video by time",
@@ -34,16 +35,16 @@ def register_skills(registry: SkillRegistry) -> None:
                 default=None,
             ),
         ],
-        examples=[
+        examples=(
             "trim:start=5 - Remove first 5 seconds",
             "trim:start=10,end=30 - Keep only seconds 10-30",
             "trim:start=0,duration=60 - Keep first minute",
-        ],
-        tags=["cut", "slice", "timing", "duration"],
+        ),
+        tags=("cut", "slice", "timing", "duration"),
     ))
 
     # Speed skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="speed",
         category=SkillCategory.TEMPORAL,
         description="Adjust playback speed while maintaining audio pitch",
@@ -58,28 +59,28 @@ def register_skills(registry: SkillRegistry) -> None:
                 max_value=10.0,
             ),
         ],
-        examples=[
+        examples=(
             "speed:factor=2.0 - Double speed",
             "speed:factor=0.5 - Half speed (slow motion)",
             "speed:factor=0.25 - Quarter speed (dramatic slow-mo)",
-        ],
-        tags=["fast", "slow", "motion", "timelapse", "slowmo"],
+        ),
+        tags=("fast", "slow", "motion", "timelapse", "slowmo"),
     ))
 
     # Reverse skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="reverse",
         category=SkillCategory.TEMPORAL,
         description="Play video backwards",
         parameters=[],
-        examples=[
+        examples=(
             "reverse - Play the entire video in reverse",
-        ],
-        tags=["backwards", "rewind"],
+        ),
+        tags=("backwards", "rewind"),
     ))
 
     # Loop skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="loop",
         category=SkillCategory.TEMPORAL,
         description="Repeat video N times",
@@ -94,14 +95,14 @@ def register_skills(registry: SkillRegistry) -> None:
                 max_value=10000,
             ),
         ],
-        examples=[
+        examples=(
             "loop:count=3 - Repeat video 3 times",
-        ],
-        tags=["repeat", "cycle"],
+        ),
+        tags=("repeat", "cycle"),
     ))
 
     # Freeze frame skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="freeze_frame",
         category=SkillCategory.TEMPORAL,
         description="Hold on a specific frame for a duration",
@@ -120,14 +121,14 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="tpad=stop_mode=clone:stop_duration={duration}",
-        examples=[
+        examples=(
             "freeze_frame:time=10,duration=3 - Freeze frame at 10s for 3 seconds",
-        ],
-        tags=["pause", "still", "hold"],
+        ),
+        tags=("pause", "still", "hold"),
     ))
 
     # FPS skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="fps",
         category=SkillCategory.TEMPORAL,
         description="Change the frame rate of the video",
@@ -143,16 +144,16 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="fps={rate}",
-        examples=[
+        examples=(
             "fps:rate=30 - Convert to 30 fps",
             "fps:rate=60 - Convert to 60 fps",
             "fps:rate=24 - Convert to 24 fps (cinematic)",
-        ],
-        tags=["framerate", "frames"],
+        ),
+        tags=("framerate", "frames"),
     ))
 
     # Scene detect — select frames at scene boundaries
-    registry.register(Skill(
+    skills.append(Skill(
         name="scene_detect",
         category=SkillCategory.TEMPORAL,
         description="Detect and keep only scene-change frames (useful for auto-splitting or thumbnails)",
@@ -166,18 +167,25 @@ def register_skills(registry: SkillRegistry) -> None:
                 min_value=0.05,
                 max_value=0.9,
             ),
+            SkillParameter(
+                name="keyframes_only",
+                type=ParameterType.BOOL,
+                description="Only decode and score keyframes (much faster, may miss cuts between keyframes)",
+                required=False,
+                default=False,
+            ),
         ],
-        ffmpeg_template="select='gt(scene,{threshold})',setpts=N/FRAME_RATE/TB",
-        examples=[
+        examples=(
             "scene_detect - Detect scene changes (default threshold)",
             "scene_detect:threshold=0.1 - Very sensitive scene detection",
             "scene_detect:threshold=0.5 - Only major scene changes",
-        ],
-        tags=["scene", "detect", "split", "cut", "auto", "boundary"],
+            "scene_detect:keyframes_only=true - Fast keyframe-only scan for thumbnails",
+        ),
+        tags=("scene", "detect", "split", "cut", "auto", "boundary"),
     ))
 
     # Silence remove — strip silent audio segments
-    registry.register(Skill(
+    skills.append(Skill(
         name="silence_remove",
         category=SkillCategory.AUDIO,
         description="Automatically remove silent segments from audio/video (great for podcasts, vlogs)",
@@ -202,15 +210,15 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="silenceremove=start_periods=1:start_duration={min_duration}:start_threshold={threshold}dB:detection=peak",
-        examples=[
+        examples=(
             "silence_remove - Remove silences below -30dB",
             "silence_remove:threshold=-40,min_duration=1 - Remove longer quiet gaps",
-        ],
-        tags=["silence", "remove", "strip", "podcast", "vlog", "auto", "jump_cut"],
+        ),
+        tags=("silence", "remove", "strip", "podcast", "vlog", "auto", "jump_cut"),
     ))
 
     # Time remap — variable speed with smooth ramping
-    registry.register(Skill(
+    skills.append(Skill(
         name="time_remap",
         category=SkillCategory.TEMPORAL,
         description="Variable speed ramping — smoothly accelerate or decelerate playback",
@@ -234,10 +242,11 @@ def register_skills(registry: SkillRegistry) -> None:
                 max_value=10.0,
             ),
         ],
-        ffmpeg_template="setpts=PTS/clip({start_speed}+({end_speed}-{start_speed})*T/5\\,0.1\\,10)",
-        examples=[
+        examples=(
             "time_remap:start_speed=1,end_speed=0.25 - Gradually slow to quarter speed",
             "time_remap:start_speed=0.5,end_speed=2 - Speed up from slow to fast",
-        ],
-        tags=["speed", "ramp", "variable", "ease", "acceleration", "deceleration"],
+        ),
+        tags=("speed", "ramp", "variable", "ease", "acceleration", "deceleration"),
     ))
+
+    registry.register_many(skills)
@@ -5,9 +5,10 @@ from ..registry import SkillRegistry, Skill, SkillParameter, SkillCategory, Para
 
 def register_skills(registry: SkillRegistry) -> None:
     """Register visual skills with the registry."""
+    skills: list[Skill] = []
 
     # Brightness skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="brightness",
         category=SkillCategory.VISUAL,
         description="Adjust video brightness",
@@ -22,15 +23,15 @@ def register_skills(registry: SkillRegistry) -> None:
                 max_value=1.0,
             ),
         ],
-        examples=[
+        examples=(
             "brightness:value=0.2 - Slightly brighter",
             "brightness:value=-0.1 - Slightly darker",
-        ],
-        tags=["light", "dark", "exposure"],
+        ),
+        tags=("light", "dark", "exposure"),
     ))
 
     # Contrast skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="contrast",
         category=SkillCategory.VISUAL,
         description="Adjust video contrast",
@@ -45,15 +46,15 @@ def register_skills(registry: SkillRegistry) -> None:
                 max_value=3.0,
             ),
         ],
-        examples=[
+        examples=(
             "contrast:value=1.2 - Higher contrast",
             "contrast:value=0.8 - Lower contrast",
-        ],
-        tags=["pop", "flat", "dynamic"],
+        ),
+        tags=("pop", "flat", "dynamic"),
     ))
 
     # Saturation skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="saturation",
         category=SkillCategory.VISUAL,
         description="Adjust color saturation",
@@ -68,16 +69,16 @@ def register_skills(registry: SkillRegistry) -> None:
                 max_value=3.0,
             ),
         ],
-        examples=[
+        examples=(
             "saturation:value=1.3 - More vibrant colors",
             "saturation:value=0.7 - Muted colors",
             "saturation:value=0 - Black and white",
-        ],
-        tags=["color", "vibrant", "muted", "grayscale", "bw"],
+        ),
+        tags=("color", "vibrant", "muted", "grayscale", "bw"),
     ))
 
     # Hue skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="hue",
         category=SkillCategory.VISUAL,
         description="Shift color hue",
@@ -92,17 +93,17 @@ def register_skills(registry: SkillRegistry) -> None:
                 max_value=180,
             ),
         ],
-        examples=[
+        examples=(
             "hue:value=30 - Warm/orange shift",
             "hue:value=-30 - Cool/blue shift",
             "hue:value=90 - Shift towards green",
             "hue:value=-90 - Shift towards purple/blue",
-        ],
-        tags=["color", "tint", "shift", "blue", "red", "green", "warm", "cool"],
+        ),
+        tags=("color", "tint", "shift", "blue", "red", "green", "warm", "cool"),
     ))
 
     # Sharpen skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="sharpen",
         category=SkillCategory.VISUAL,
         description="Increase image sharpness",
@@ -117,15 +118,15 @@ def register_skills(registry: SkillRegistry) -> None:
                 max_value=3.0,
             ),
         ],
-        examples=[
+        examples=(
             "sharpen:amount=1.0 - Standard sharpening",
             "sharpen:amount=0.5 - Subtle sharpening",
-        ],
-        tags=["crisp", "detail", "clarity"],
+        ),
+        tags=("crisp", "detail", "clarity"),
     ))
 
     # Blur skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="blur",
         category=SkillCategory.VISUAL,
         description="Apply blur effect",
@@ -140,15 +141,15 @@ def register_skills(registry: SkillRegistry) -> None:
                 max_value=50,
             ),
         ],
-        examples=[
+        examples=(
             "blur:radius=3 - Slight blur",
             "blur:radius=10 - Strong blur",
-        ],
-        tags=["soft", "smooth", "defocus"],
+        ),
+        tags=("soft", "smooth", "defocus"),
     ))
 
     # Denoise skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="denoise",
         category=SkillCategory.VISUAL,
         description="Reduce video noise",
@@ -159,18 +160,18 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="Denoise strength",
                 required=False,
                 default="medium",
-                choices=["light", "medium", "strong"],
+                choices=("light", "medium", "strong"),
             ),
         ],
-        examples=[
+        examples=(
             "denoise:strength=light - Subtle noise reduction",
             "denoise:strength=strong - Aggressive noise reduction",
-        ],
-        tags=["grain", "clean", "smooth"],
+        ),
+        tags=("grain", "clean", "smooth"),
     ))
 
     # Vignette skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="vignette",
         category=SkillCategory.VISUAL,
         description="Add vignette effect (darkened edges)",
@@ -185,15 +186,15 @@ def register_skills(registry: SkillRegistry) -> None:
                 max_value=1.0,
             ),
         ],
-        examples=[
+        examples=(
             "vignette:intensity=0.2 - Subtle vignette",
             "vignette:intensity=0.5 - Strong vignette",
-        ],
-        tags=["edges", "focus", "cinematic"],
+        ),
+        tags=("edges", "focus", "cinematic"),
     ))
 
     # Fade skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="fade",
         category=SkillCategory.VISUAL,
         description="Add fade in/out effect (from/to black)",
@@ -204,7 +205,7 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="Fade type",
                 required=False,
                 default="in",
-                choices=["in", "out", "both"],
+                choices=("in", "out", "both"),
             ),
             SkillParameter(
                 name="start",
@@ -221,16 +222,16 @@ def register_skills(registry: SkillRegistry) -> None:
                 default=1,
             ),
         ],
-        examples=[
+        examples=(
             "fade:type=in,duration=2 - 2 second fade in from start",
             "fade:type=out,start=58,duration=2 - Fade out starting at 58s",
             "fade:type=both,duration=1 - Fade in at start + fade out at end (1s each)",
-        ],
-        tags=["transition", "black", "intro", "outro"],
+        ),
+        tags=("transition", "black", "intro", "outro"),
     ))
 
     # Color balance skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="colorbalance",
         category=SkillCategory.VISUAL,
         description="Adjust color balance (shadows, midtones, highlights)",
@@ -278,19 +279,18 @@ def register_skills(registry: SkillRegistry) -> None:
                 default=0,
             ),
         ],
-        ffmpeg_template="colorbalance=rs={rs}:gs={gs}:bs={bs}:rm={rm}:gm={gm}:bm={bm}",
-        examples=[
+        examples=(
             "colorbalance:rs=0.1,rm=0.05 - Warm tones",
             "colorbalance:bs=0.1,bm=0.05 - Cool tones",
             "colorbalance:rs=-0.3,gs=-0.3,bs=0.5,rm=-0.3,gm=-0.3,bm=0.5 - Strong blue tint",
             "colorbalance:rs=0.5,gs=-0.3,bs=-0.3,rm=0.5,gm=-0.3,bm=-0.3 - Strong red tint",
             "colorbalance:rs=-0.3,gs=0.5,bs=-0.3,rm=-0.3,gm=0.5,bm=-0.3 - Strong green tint",
-        ],
-        tags=["color", "grade", "warm", "cool", "tint", "blue", "red", "green", "orange", "teal"],
+        ),
+        tags=("color", "grade", "warm", "cool", "tint", "blue", "red", "green", "orange", "teal"),
     ))
 
     # Noise/grain skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="noise",
         category=SkillCategory.VISUAL,
         description="Add noise/grain to video",
@@ -310,19 +310,19 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="Noise type",
                 required=False,
                 default="uniform",
-                choices=["uniform", "gaussian"],
+                choices=("uniform", "gaussian"),
             ),
         ],
         ffmpeg_template="noise=alls={amount}:allf=t+u",
-        examples=[
+        examples=(
             "noise:amount=15 - Subtle film grain",
             "noise:amount=40,type=gaussian - Heavy grain",
-        ],
-        tags=["grain", "film", "texture", "analog"],
+        ),
+        tags=("grain", "film", "texture", "analog"),
     ))
 
     # Curves skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="curves",
         category=SkillCategory.VISUAL,
         description="Apply color curves preset",
@@ -333,7 +333,7 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="Curves preset",
                 required=False,
                 default="increase_contrast",
-                choices=[
+                choices=(
                     "none",
                     "color_negative",
                     "cross_process",
@@ -345,19 +345,19 @@ def register_skills(registry: SkillRegistry) -> None:
                     "negative",
                     "strong_contrast",
                     "vintage",
-                ],
+                ),
             ),
         ],
         ffmpeg_template="curves=preset={preset}",
-        examples=[
+        examples=(
             "curves:preset=vintage - Vintage color look",
             "curves:preset=increase_contrast - More contrast",
-        ],
-        tags=["color", "grade", "look", "lut"],
+        ),
+        tags=("color", "grade", "look", "lut"),
     ))
 
     # Text overlay skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="text_overlay",
         category=SkillCategory.VISUAL,
         description="Add text overlay on video",
@@ -390,7 +390,7 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="Text position",
                 required=False,
                 default="center",
-                choices=["center", "top", "bottom", "top_left", "top_right", "bottom_left", "bottom_right"],
+                choices=("center", "top", "bottom", "top_left", "top_right", "bottom_left", "bottom_right"),
             ),
             SkillParameter(
                 name="font",
@@ -454,29 +454,29 @@ def register_skills(registry: SkillRegistry) -> None:
                 max_value=30,
             ),
         ],
-        examples=[
+        examples=(
             "text_overlay:text=Hello World - Center text",
             "text_overlay:text=Subscribe!,position=bottom,color=yellow,size=72 - Large yellow text at bottom",
             "text_overlay:text=REC,position=top_left,color=red,blink=1 - Blinking red REC indicator",
-        ],
-        tags=["text", "title", "caption", "subtitle", "watermark", "label", "blink", "flash"],
+        ),
+        tags=("text", "title", "caption", "subtitle", "watermark", "label", "blink", "flash"),
     ))
 
     # Invert/negative skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="invert",
         category=SkillCategory.VISUAL,
         description="Invert colors (photo negative effect)",
         parameters=[],
         ffmpeg_template="negate",
-        examples=[
+        examples=(
             "invert - Invert all colors",
-        ],
-        tags=["negative", "negate", "reverse", "invert"],
+        ),
+        tags=("negative", "negate", "reverse", "invert"),
     ))
 
     # Edge detection skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="edge_detect",
         category=SkillCategory.VISUAL,
         description="Apply edge detection effect",
@@ -487,7 +487,7 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="Edge detection mode",
                 required=False,
                 default="canny",
-                choices=["canny", "colormix"],
+                choices=("canny", "colormix"),
             ),
             SkillParameter(
                 name="low",
@@ -509,15 +509,15 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="edgedetect=low={low}:high={high}:mode={mode}",
-        examples=[
+        examples=(
             "edge_detect - Standard edge detection",
             "edge_detect:mode=colormix - Colorful edges",
-        ],
-        tags=["edge", "outline", "sketch", "line", "cartoon"],
+        ),
+        tags=("edge", "outline", "sketch", "line", "cartoon"),
     ))
 
     # Pixelate/mosaic skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="pixelate",
         category=SkillCategory.VISUAL,
         description="Pixelate video (mosaic/pixel art effect)",
@@ -532,16 +532,16 @@ def register_skills(registry: SkillRegistry) -> None:
                 max_value=50,
             ),
         ],
-        examples=[
+        examples=(
             "pixelate - Standard pixelation",
             "pixelate:factor=20 - Heavy pixelation",
             "pixelate:factor=4 - Subtle pixelation",
-        ],
-        tags=["mosaic", "pixel", "censor", "blur", "8bit", "retro"],
+        ),
+        tags=("mosaic", "pixel", "censor", "blur", "8bit", "retro"),
     ))
 
     # Gamma correction skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="gamma",
         category=SkillCategory.VISUAL,
         description="Adjust gamma correction",
@@ -557,15 +557,15 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="eq=gamma={value}",
-        examples=[
+        examples=(
             "gamma:value=1.5 - Brighter midtones",
             "gamma:value=0.7 - Darker midtones",
-        ],
-        tags=["gamma", "midtones", "exposure", "light"],
+        ),
+        tags=("gamma", "midtones", "exposure", "light"),
     ))
 
     # Exposure adjustment skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="exposure",
         category=SkillCategory.VISUAL,
         description="Adjust video exposure",
@@ -581,15 +581,66 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="eq=gamma={value}:gamma_weight=0.5",
-        examples=[
+        examples=(
             "exposure:value=1.0 - One stop brighter",
             "exposure:value=-0.5 - Half stop darker",
+        ),
+        tags=("light", "bright", "dark", "ev", "stops"),
+    ))
+
+    # Combined eq adjustment — all tone knobs in one filter pass
+    skills.append(Skill(
+        name="eq_adjust",
+        category=SkillCategory.VISUAL,
+        description="Adjust brightness, contrast, saturation and gamma together in a single pass",
+        parameters=[
+            SkillParameter(
+                name="brightness",
+                type=ParameterType.FLOAT,
+                description="Brightness adjustment (-1.0 to 1.0, 0 = no change)",
+                required=False,
+                default=0.0,
+                min_value=-1.0,
+                max_value=1.0,
+            ),
+            SkillParameter(
+                name="contrast",
+                type=ParameterType.FLOAT,
+                description="Contrast multiplier (1.0 = no change)",
+                required=False,
+                default=1.0,
+                min_value=0.0,
+                max_value=3.0,
+            ),
+            SkillParameter(
+                name="saturation",
+                type=ParameterType.FLOAT,
+                description="Saturation multiplier (0 = grayscale, 1.0 = no change)",
+                required=False,
+                default=1.0,
+                min_value=0.0,
+                max_value=3.0,
+            ),
+            SkillParameter(
+                name="gamma",
+                type=ParameterType.FLOAT,
+                description="Gamma value (< 1.0 = darker, > 1.0 = brighter)",
+                required=False,
+                default=1.0,
+                min_value=0.1,
+                max_value=4.0,
+            ),
         ],
-        tags=["light", "bright", "dark", "ev", "stops"],
+        ffmpeg_template="eq=brightness={brightness}:contrast={contrast}:saturation={saturation}:gamma={gamma}",
+        examples=(
+            "eq_adjust:brightness=0.05,contrast=1.2,saturation=1.3 - Punchier image in one pass",
+            "eq_adjust:contrast=1.1,gamma=0.9 - More contrast, slightly darker midtones",
+        ),
+        tags=("light", "contrast", "color", "gamma", "tone", "adjust"),
     ))
 
     # Chroma key (green screen) skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="chromakey",
         category=SkillCategory.VISUAL,
         description="Remove a color background (green screen / chroma key)",
@@ -620,15 +671,15 @@ def register_skills(registry: SkillRegistry) -> None:
                 max_value=1.0,
             ),
         ],
-        examples=[
+        examples=(
             "chromakey - Remove green screen",
             "chromakey:color=0x0000FF,similarity=0.2 - Remove blue screen",
-        ],
-        tags=["greenscreen", "bluescreen", "key", "remove", "background", "transparent"],
+        ),
+        tags=("greenscreen", "bluescreen", "key", "remove", "background", "transparent"),
     ))
 
     # Deband skill
-    registry.register(Skill(
+    skills.append(Skill(
         name="deband",
         category=SkillCategory.VISUAL,
         description="Remove color banding artifacts (especially from AI-generated video)",
@@ -659,16 +710,16 @@ def register_skills(registry: SkillRegistry) -> None:
                 default=True,
             ),
         ],
-        examples=[
+        examples=(
             "deband - Remove color banding",
             "deband:threshold=0.15 - Aggressive debanding",
             "deband:threshold=0.3,range=32 - Heavy debanding (AI video)",
-        ],
-        tags=["banding", "gradient", "smooth", "quality", "ai"],
+        ),
+        tags=("banding", "gradient", "smooth", "quality", "ai"),
     ))
 
     # White balance correction
-    registry.register(Skill(
+    skills.append(Skill(
         name="white_balance",
         category=SkillCategory.VISUAL,
         description="Adjust white balance / color temperature of footage",
@@ -684,16 +735,16 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="colortemperature={temperature}",
-        examples=[
+        examples=(
             "white_balance - Neutral white balance (6500K)",
             "white_balance:temperature=3200 - Warm tungsten white balance",
             "white_balance:temperature=9000 - Cool/blue white balance",
-        ],
-        tags=["white", "balance", "temperature", "kelvin", "color", "correct"],
+        ),
+        tags=("white", "balance", "temperature", "kelvin", "color", "correct"),
     ))
 
     # Shadows & highlights adjustment
-    registry.register(Skill(
+    skills.append(Skill(
         name="shadows_highlights",
         category=SkillCategory.VISUAL,
         description="Separately adjust shadows and highlights (lift dark areas, recover bright areas)",
@@ -718,11 +769,11 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="colorlevels=rimin={shadows}:gimin={shadows}:bimin={shadows}:rimax={highlights}:gimax={highlights}:bimax={highlights}",
-        examples=[
+        examples=(
             "shadows_highlights - Slightly lift shadows and recover highlights",
             "shadows_highlights:shadows=0.1,highlights=0.85 - Strong shadow lift, pull highlights",
-        ],
-        tags=["shadows", "highlights", "lift", "recover", "exposure", "dynamic_range"],
+        ),
+        tags=("shadows", "highlights", "lift", "recover", "exposure", "dynamic_range"),
     ))
 
     # Split toning — different colors for shadows vs highlights
@@ -732,7 +783,7 @@ def register_skills(registry: SkillRegistry) -> None:
     # The intensity parameter scales everything.
     # Since ffmpeg_template can't do conditional mapping, use a generic
     # colorbalance formula that exposes all 6 channels as parameters.
-    registry.register(Skill(
+    skills.append(Skill(
         name="split_tone",
         category=SkillCategory.VISUAL,
         description="Apply different color tints to shadows and highlights (split toning). Set per-channel values directly.",
@@ -793,16 +844,16 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="colorbalance=rs={rs}:gs={gs}:bs={bs}:rh={rh}:gh={gh}:bh={bh}",
-        examples=[
+        examples=(
             "split_tone - Blue shadows, warm highlights",
             "split_tone:bs=0.4,gs=0.2,rh=0.4,gh=0.1,bh=-0.3 - Teal shadows, orange highlights",
             "split_tone:rs=0.0,gs=0.0,bs=0.5,rh=0.5,gh=0.2,bh=-0.2 - Cool shadows, warm highlights",
-        ],
-        tags=["split", "tone", "grade", "color", "shadows", "highlights", "cinematic"],
+        ),
+        tags=("split", "tone", "grade", "color", "shadows", "highlights", "cinematic"),
     ))
 
     # Deflicker — fix flickering footage
-    registry.register(Skill(
+    skills.append(Skill(
         name="deflicker",
         category=SkillCategory.VISUAL,
         description="Remove flicker from timelapse, slow-motion, or fluorescent-lit footage",
@@ -822,19 +873,19 @@ def register_skills(registry: SkillRegistry) -> None:
                 description="Flicker detection mode",
                 required=False,
                 default="pm",
-                choices=["am", "gm", "pm"],
+                choices=("am", "gm", "pm"),
             ),
         ],
         ffmpeg_template="deflicker=size={size}:mode={mode}",
-        examples=[
+        examples=(
             "deflicker - Standard deflicker (5-frame window)",
             "deflicker:size=15 - Aggressive deflicker for bad timelapse",
-        ],
-        tags=["flicker", "timelapse", "fix", "strobe", "fluorescent", "smooth"],
+        ),
+        tags=("flicker", "timelapse", "fix", "strobe", "fluorescent", "smooth"),
     ))
 
     # Unsharp mask — fine-grained sharpening
-    registry.register(Skill(
+    skills.append(Skill(
         name="unsharp_mask",
         category=SkillCategory.VISUAL,
         description="Apply unsharp mask sharpening with separate luma/chroma control",
@@ -868,10 +919,12 @@ def register_skills(registry: SkillRegistry) -> None:
             ),
         ],
         ffmpeg_template="unsharp={luma_size}:{luma_size}:{luma_amount}:{luma_size}:{luma_size}:{chroma_amount}",
-        examples=[
+        examples=(
             "unsharp_mask - Standard luma sharpening",
             "unsharp_mask:luma_amount=2.5 - Strong sharpening",
             "unsharp_mask:luma_amount=-1.0 - Subtle blur (softening)",
-        ],
-        tags=["sharpen", "unsharp", "luma", "chroma", "detail", "crisp", "soft"],
+        ),
+        tags=("sharpen", "unsharp", "luma", "chroma", "detail", "crisp", "soft"),
     ))
+
+    registry.register_many(skills)
@@ -1,5 +1,6 @@
 """Skill composition engine for building FFMPEG pipelines."""
 
+import re
 from dataclasses import dataclass, field
 from typing import Optional, Any
 from pathlib import Path
@@ -15,6 +16,50 @@ except ImportError:
 _VIDEO_EXTENSIONS = {".mp4", ".mkv", ".avi", ".mov", ".webm", ".flv", ".wmv", ".ts", ".m4v"}
 
 
+# NVENC takes -cq instead of -crf and its own preset names.  At the same
+# number NVENC's CQ gives somewhat lower quality than x264's CRF, so the
+# mapping subtracts a small offset; it is precomputed for every CRF
+# (0..51) once.  CQ only acts as the quality target in VBR mode with no
+# bitrate cap, hence the accompanying -rc vbr -b:v 0.
+_NVENC_ENCODERS = frozenset({"h264_nvenc", "hevc_nvenc"})
+_NVENC_CQ_OFFSET = 3
+_NVENC_CQ = tuple(str(max(1, crf - _NVENC_CQ_OFFSET)) for crf in range(52))
+_NVENC_PRESETS = {
+    "ultrafast": "p1", "superfast": "p1", "veryfast": "p2", "faster": "p3",
+    "fast": "p3", "medium": "p4", "slow": "p5", "slower": "p6", "veryslow": "p7",
+}
+
+# VideoToolbox ignores -crf and has no -preset; its constant-quality knob
+# is -q:v on a 1..100 scale (higher is better).  CRF 23 lands near 60.
+_VIDEOTOOLBOX_ENCODERS = frozenset({"h264_videotoolbox", "hevc_videotoolbox"})
+_VIDEOTOOLBOX_Q = tuple(str(max(1, min(100, round(100 - crf * 1.75)))) for crf in range(52))
+
+# scale_2x output, rewritten to scale_cuda when the whole job can stay in
+# GPU memory (CUDA decode -> scale_cuda -> NVENC).  scale_cuda has no
+# spline kernel; lanczos is the closest.
+_SCALE_2X_RE = re.compile(r"scale=iw\*(\d+):ih\*\1:flags=(\w+)")
+_CUDA_INTERP = {
+    "lanczos": "lanczos", "bicubic": "bicubic",
+    "bilinear": "bilinear", "spline": "lanczos",
+}
+
+
+# Output/input flags that change which audio, or how much of it, reaches
+# the encoder.  Once an earlier step emits one of these (or any audio
+# filter / filter_complex), the raw input no longer matches what a later
+# loudness measurement would see.
+_AUDIO_ALTERING_FLAGS = frozenset({
+    "-ss", "-sseof", "-t", "-to", "-stream_loop", "-ac", "-an", "-map",
+})
+
+# eq options that adjacent single-purpose eq filters may be fused on.
+# Luma options interact (contrast -> brightness -> gamma, with clipping
+# between separate filters), so a fused eq holds at most one of them;
+# saturation only touches chroma and fuses with anything.
+_EQ_LUMA_KEYS = frozenset({"contrast", "brightness", "gamma"})
+_EQ_FUSABLE_KEYS = _EQ_LUMA_KEYS | {"saturation"}
+
+
 def _is_video_file(path: str) -> bool:
     """Return True if the file extension indicates a video file."""
     return Path(path).suffix.lower() in _VIDEO_EXTENSIONS
@@ -241,6 +286,155 @@ class SkillComposer:
                 i += 1
         return deduped
 
+    @staticmethod
+    def _adapt_rate_control(output_options: list[str]) -> list[str]:
+        """Rewrite x264-style ``-crf``/``-preset`` for the final encoder.
+
+        Quality skills always speak x264.  When a later step selected an
+        NVENC encoder, ``-crf`` is silently ignored and x264 preset names
+        are rejected, so both are translated.  ``-cq`` comes with
+        ``-rc vbr`` and ``-b:v 0`` (unless a bitrate was set explicitly),
+        otherwise NVENC keeps its default bitrate target.  VideoToolbox
+        gets ``-q:v`` for ``-crf`` and drops ``-preset``.  Expects
+        deduplicated options (one ``-c:v``).
+        """
+        try:
+            encoder = output_options[output_options.index("-c:v") + 1]
+        except (ValueError, IndexError):
+            return output_options
+        if encoder in _VIDEOTOOLBOX_ENCODERS:
+            return SkillComposer._adapt_videotoolbox(output_options)
+        if encoder not in _NVENC_ENCODERS:
+            return output_options
+        adapted: list[str] = []
+        used_cq = False
+        i = 0
+        while i < len(output_options):
+            flag = output_options[i]
+            val = output_options[i + 1] if i + 1 < len(output_options) else None
+            if flag == "-crf" and val is not None:
+                try:
+                    crf = int(float(val))
+                except ValueError:
+                    pass
+                else:
+                    adapted += ["-cq", _NVENC_CQ[max(0, min(51, crf))]]
+                    used_cq = True
+                    i += 2
+                    continue
+            elif flag == "-preset" and val in _NVENC_PRESETS:
+                adapted += ["-preset", _NVENC_PRESETS[val]]
+                i += 2
+                continue
+            adapted.append(flag)
+            i += 1
+        if used_cq:
+            if "-rc" not in adapted:
+                adapted += ["-rc", "vbr"]
+            if "-b:v" not in adapted:
+                adapted += ["-b:v", "0"]
+        return adapted
+
+    @staticmethod
+    def _adapt_videotoolbox(output_options: list[str]) -> list[str]:
+        """Map ``-crf`` to VideoToolbox ``-q:v``; drop x264 ``-preset``."""
+        adapted: list[str] = []
+        i = 0
+        while i < len(output_options):
+            flag = output_options[i]
+            val = output_options[i + 1] if i + 1 < len(output_options) else None
+            if flag == "-crf" and val is not None:
+                try:
+                    crf = int(float(val))
+                except ValueError:
+                    pass
+                else:
+                    adapted += ["-q:v", _VIDEOTOOLBOX_Q[max(0, min(51, crf))]]
+                    i += 2
+                    continue
+            elif flag == "-preset" and val is not None:
+                i += 2
+                continue
+            adapted.append(flag)
+            i += 1
+        return adapted
+
+    @staticmethod
+    def _fuse_eq_filters(video_filters: list[str]) -> list[str]:
+        """Merge runs of single-option eq filters into one eq pass.
+
+        brightness/contrast/saturation each emit their own ``eq=``
+        filter, so stacking them costs a full frame pass apiece.  Merging
+        is only done where the result is identical to the chain: keys
+        must be distinct and at most one luma option may be present.
+        """
+        fused: list[str] = []
+        prev_opts: dict[str, str] | None = None
+        for vf in video_filters:
+            opts = None
+            if vf.startswith("eq=") and "," not in vf and "[" not in vf:
+                opts = dict(part.partition("=")[::2] for part in vf[3:].split(":"))
+                if not opts.keys() <= _EQ_FUSABLE_KEYS:
+                    opts = None
+            if (
+                opts is not None
+                and prev_opts is not None
+                and prev_opts.keys().isdisjoint(opts)
+                and len((prev_opts.keys() | opts.keys()) & _EQ_LUMA_KEYS) <= 1
+            ):
+                prev_opts.update(opts)
+                fused[-1] = "eq=" + ":".join(f"{k}={v}" for k, v in prev_opts.items())
+                continue
+            fused.append(vf)
+            prev_opts = opts
+        return fused
+
+    @staticmethod
+    def _gpu_video_filters(
+        video_filters: list[str],
+        input_options: list[str],
+        output_options: list[str],
+    ) -> list[str] | None:
+        """Return the video chain for an all-GPU CUDA job, or None.
+
+        Applies when the input is decoded with ``-hwaccel cuda``, the
+        final encoder is NVENC and every video filter (if any) is a
+        scale_2x upscale, which is rewritten to scale_cuda.  Anything
+        else needs frames in system memory, so decoded frames must not
+        stay on the GPU.
+        """
+        if "-hwaccel" not in input_options:
+            return None
+        if input_options[input_options.index("-hwaccel") + 1] != "cuda":
+            return None
+        encoders = [
+            output_options[i + 1] for i in range(len(output_options) - 1)
+            if output_options[i] == "-c:v"
+        ]
+        if not encoders or encoders[-1] not in _NVENC_ENCODERS:
+            return None
+        # Output pixel format/size conversions insert a CPU scaler.
+        if "-pix_fmt" in output_options or "-s" in output_options:
+            return None
+        gpu_filters = []
+        for vf in video_filters:
+            m = _SCALE_2X_RE.fullmatch(vf)
+            if not m or m.group(2) not in _CUDA_INTERP:
+                return None
+            factor = m.group(1)
+            gpu_filters.append(
+                f"scale_cuda=w=iw*{factor}:h=ih*{factor}"
+                f":interp_algo={_CUDA_INTERP[m.group(2)]}"
+            )
+        if gpu_filters:
+            try:
+                from .handlers.encoding import _available_filters
+            except ImportError:
+                from skills.handlers.encoding import _available_filters
+            if "scale_cuda" not in _available_filters():
+                return None
+        return gpu_filters
+
     @staticmethod
     def _resolve_overlay_inputs(
         pipeline: 'Pipeline',
@@ -548,6 +742,10 @@ class SkillComposer:
         audio_filters = []
         output_options = []
         complex_filters = []  # filter_complex strings from multi-stream skills
+        main_input_options = []  # skill input options on the main input
+        audio_modified = False  # an earlier step changed the input audio
+        video_codec = None  # last -c:v chosen by an earlier step
+        deferred_normalize = []  # (audio filter index, skill, params)
 
         # Pre-scan for skills that handle audio internally (xfade, concat)
         # so we can skip redundant audio_crossfade steps the LLM may add.
@@ -685,17 +883,20 @@ class SkillComposer:
             # 6. Security: Strict Allowlist Filtering
             # Remove any parameters not defined in the schema to prevent handlers
             # from using unvalidated input (e.g. arbitrary file paths in 'font').
-            allowed_params = set(skill._param_map.keys())
-            filtered_params = {}
-            for k, v in step.params.items():
-                if k in allowed_params:
-                    filtered_params[k] = v
-                else:
-                    import logging
-                    logging.getLogger("ffmpega").warning(
-                        f"Security: Dropping unknown parameter '{k}' for skill '{step.skill_name}'"
-                    )
-            step.params = filtered_params
+            # ⚡ Perf: name set is frozen on the skill; the common all-known
+            # case is a single C-level subset check.
+            allowed_params = skill._param_names
+            if not step.params.keys() <= allowed_params:
+                filtered_params = {}
+                for k, v in step.params.items():
+                    if k in allowed_params:
+                        filtered_params[k] = v
+                    else:
+                        import logging
+                        logging.getLogger("ffmpega").warning(
+                            f"Security: Dropping unknown parameter '{k}' for skill '{step.skill_name}'"
+                        )
+                step.params = filtered_params
 
             # Inject multi-input metadata for handlers that need it
             if pipeline.input_path:
@@ -715,6 +916,8 @@ class SkillComposer:
                 step.params["_input_width"] = pipeline.metadata["_input_width"]
             if "_input_height" in pipeline.metadata:
                 step.params["_input_height"] = pipeline.metadata["_input_height"]
+            if "_input_sample_rate" in pipeline.metadata:
+                step.params["_input_sample_rate"] = pipeline.metadata["_input_sample_rate"]
             if "_audio_input_path" in pipeline.metadata:
                 step.params["_audio_input_path"] = pipeline.metadata["_audio_input_path"]
             if "_whisper_device" in pipeline.metadata:
@@ -735,6 +938,14 @@ class SkillComposer:
                 step.params["_enable_flux_klein"] = pipeline.metadata["_enable_flux_klein"]
             if "_mmaudio_mode" in pipeline.metadata:
                 step.params["_mmaudio_mode"] = pipeline.metadata["_mmaudio_mode"]
+            # Measurement-based handlers (normalize) must not analyse the
+            # raw input once earlier steps have changed its audio.
+            if audio_modified:
+                step.params["_audio_modified"] = True
+            # quality only adds rate control on top of an encoder that an
+            # earlier step (convert, hwaccel, ...) already picked.
+            if video_codec is not None:
+                step.params["_video_codec"] = video_codec
             # Provide mutable reference so handlers can write back metadata
             # (e.g. _f_auto_mask stores _mask_video_path for overlay generation)
             step.params["_metadata_ref"] = pipeline.metadata
@@ -776,8 +987,22 @@ class SkillComposer:
             if exclude:
                 step.params["_exclude_inputs"] = exclude
 
+            # normalize may measure the raw input, which is only valid if
+            # no step anywhere (before or after it) trims or remaps the
+            # audio, so it is rendered once every step has been seen.
+            if resolved_name == "normalize":
+                deferred_normalize.append((len(audio_filters), skill, step.params))
+                audio_modified = True
+                continue
+
             # Get filters/options for this skill
             vf, af, opts, fc, input_opts = self._skill_to_filters(skill, step.params)
+            if (af or fc or not _AUDIO_ALTERING_FLAGS.isdisjoint(opts)
+                    or not _AUDIO_ALTERING_FLAGS.isdisjoint(input_opts)):
+                audio_modified = True
+            for i in range(len(opts) - 1):
+                if opts[i] == "-c:v":
+                    video_codec = opts[i + 1]
             video_filters.extend(vf)
             audio_filters.extend(af)
             output_options.extend(opts)
@@ -786,6 +1011,20 @@ class SkillComposer:
             if input_opts:
                 # Add input options to the main input (index 0)
                 builder.add_input_options(pipeline.input_path, input_opts)
+                main_input_options.extend(input_opts)
+
+        if deferred_normalize:
+            audio_cut = (
+                not _AUDIO_ALTERING_FLAGS.isdisjoint(output_options)
+                or not _AUDIO_ALTERING_FLAGS.isdisjoint(main_input_options)
+            )
+            # Insert back to front so earlier indices stay valid
+            for index, skill, params in reversed(deferred_normalize):
+                if audio_cut:
+                    params["_audio_modified"] = True
+                _vf, af, opts, _fc, _input_opts = self._skill_to_filters(skill, params)
+                audio_filters[index:index] = af
+                output_options.extend(opts)
 
         # Subtitle filters (ass=, subtitles=) should always render LAST
         # so they appear on top of letterbox bars, neon glow, etc.
@@ -793,6 +1032,7 @@ class SkillComposer:
         _sub_filters = [f for f in video_filters if f.startswith(("ass=", "subtitles="))]
         if _sub_filters:
             video_filters = [f for f in video_filters if f not in _sub_filters] + _sub_filters
+        video_filters = self._fuse_eq_filters(video_filters)
 
         output_options, audio_filters = self._resolve_audio_conflicts(
             output_options, audio_filters, step_names
@@ -1060,13 +1300,35 @@ class SkillComposer:
                 output_options = new_opts
             else:
                 # Simple path — no filter_complex conflict
+                gpu_filters = self._gpu_video_filters(
+                    video_filters, main_input_options, output_options,
+                )
+                if gpu_filters is not None:
+                    # Keep decoded frames in GPU memory: CUDA decode feeds
+                    # NVENC (via scale_cuda) without a download/upload.
+                    builder.add_input_options(
+                        pipeline.input_path, ["-hwaccel_output_format", "cuda"],
+                    )
+                    video_filters = gpu_filters
                 for vf in video_filters:
                     builder.vf(vf)
                 for af in audio_filters:
                     builder.af(af)
 
+        # Per-job filter thread cap.  Batch mode sets this when several
+        # ffmpeg processes run at once so each graph doesn't spawn one
+        # filter thread per core and oversubscribe the host.
+        filter_threads = int(pipeline.metadata.get("_filter_threads") or 0)
+        if filter_threads > 0:
+            builder.global_options(
+                "-filter_threads", str(filter_threads),
+                "-filter_complex_threads", str(filter_threads),
+            )
+
         # Apply output options — deduplicate key-value flags
-        deduped_opts = self._dedup_output_options(output_options)
+        deduped_opts = self._adapt_rate_control(
+            self._dedup_output_options(output_options)
+        )
         builder.output_options(*deduped_opts)
         builder.output(pipeline.output_path)
 
@@ -1135,31 +1397,9 @@ class SkillComposer:
 
         # If skill has a template, use it
         if skill.ffmpeg_template:
-            template = skill.ffmpeg_template
-
-            # Optimization: Skip replacements entirely if there are no placeholders
-            if "{" in template:
-                for key, value in params.items():
-                    val_str = str(value)
-                    if isinstance(value, str):
-                        val_str = sanitize_text_param(val_str)
-
-                    # Unconditional replace is fast here because user params are few
-                    # and likely present in the template.
-                    template = template.replace(f"{{{key}}}", val_str)
-
-                # Resolve any remaining {placeholder} with skill defaults
-                if "{" in template:
-                    for sp in (skill.parameters or []):
-                        if sp.default is not None:
-                            # Optimization: "Check First" pattern. Skills often have
-                            # many default parameters that aren't in the template.
-                            placeholder = f"{{{sp.name}}}"
-                            if placeholder in template:
-                                template = template.replace(placeholder, str(sp.default))
-                                # Optimization: Early break if all placeholders are resolved
-                                if "{" not in template:
-                                    break
+            # ⚡ Perf: template is pre-parsed at Skill construction, so this
+            # is a single join over literal segments + param lookups.
+            template = skill.render_template(params, escape=sanitize_text_param)
 
             # Determine if it's a video filter, audio filter, or output option
             if template.startswith("-"):
@@ -1171,33 +1411,10 @@ class SkillComposer:
 
         # If skill has a pipeline, recursively compose
         elif skill.pipeline:
-            # Build a defaults map from the skill's parameter definitions
-            # so we can resolve placeholders that weren't in the user params
-            # (e.g. when validation dropped a param, or it wasn't provided).
-            _defaults = {}
-            for sp in (skill.parameters or []):
-                if sp.default is not None:
-                    _defaults[sp.name] = str(sp.default)
-
-            for step_str in skill.pipeline:
-                # Optimization: Skip replacements entirely if there are no placeholders
-                if "{" in step_str:
-                    # Substitute {placeholder} values from parent params
-                    for key, value in params.items():
-                        step_str = step_str.replace(f"{{{key}}}", str(value))
-
-                    # Resolve any remaining {placeholder} with skill defaults
-                    # to prevent literal "{ratio}" from reaching handlers.
-                    if "{" in step_str:
-                        for key, default_val in _defaults.items():
-                            # Optimization: "Check First" pattern
-                            placeholder = f"{{{key}}}"
-                            if placeholder in step_str:
-                                step_str = step_str.replace(placeholder, default_val)
-                                # Optimization: Early break if all placeholders are resolved
-                                if "{" not in step_str:
-                                    break
-
+            # ⚡ Perf: step strings are pre-parsed like templates; unresolved
+            # placeholders fall back to the skill's defaults so a literal
+            # "{ratio}" never reaches a sub-handler.
+            for step_str in skill.render_pipeline(params):
                 # Parse step string (format: "skill_name:param1=val1,param2=val2")
                 if ":" in step_str:
                     sub_skill_name, params_str = step_str.split(":", 1)
@@ -1365,7 +1582,7 @@ def _get_dispatch() -> dict:
     from .handlers import (  # noqa: F401
         # temporal
         _f_trim, _f_speed, _f_reverse, _f_loop, _f_boomerang,
-        _f_jump_cut, _f_beat_sync,
+        _f_jump_cut, _f_beat_sync, _f_scene_detect, _f_time_remap,
         # spatial
         _f_resize, _f_crop, _f_pad, _f_rotate, _f_flip, _f_zoom,
         _f_ken_burns, _f_mirror, _f_caption_space, _f_lens_correction,
@@ -1373,7 +1590,7 @@ def _get_dispatch() -> dict:
         _f_perspective, _f_fill_borders, _f_deshake, _f_frame_blend,
         # visual
         _f_brightness, _f_contrast, _f_saturation, _f_hue,
-        _f_sharpen, _f_blur, _f_denoise, _f_vignette, _f_fade,
+        _f_sharpen, _f_blur, _f_denoise, _f_vignette, _f_fade, _f_colorbalance,
         _f_pixelate, _f_posterize, _f_color_grade, _f_chromakey_simple,
         _f_deband, _f_color_temperature, _f_selective_color, _f_monochrome,
         _f_chromatic_aberration, _f_sketch, _f_glow, _f_ghost_trail,
@@ -1383,7 +1600,7 @@ def _get_dispatch() -> dict:
         _f_despill, _f_remove_background, _f_blend, _f_color_match,
         _f_datamosh, _f_mask_blur, _f_lut_apply,
         # audio
-        _f_volume, _f_normalize, _f_fade_audio, _f_remove_audio,
+        _f_volume, _f_normalize, _f_pitch, _f_fade_audio, _f_remove_audio,
         _f_extract_audio, _f_replace_audio, _f_audio_crossfade, _f_mix_audio,
         # encoding
         _f_compress, _f_convert, _f_bitrate, _f_quality, _f_gif,
@@ -1420,6 +1637,8 @@ def _get_dispatch() -> dict:
         "boomerang": _f_boomerang,
         "jump_cut": _f_jump_cut,
         "beat_sync": _f_beat_sync,
+        "scene_detect": _f_scene_detect,
+        "time_remap": _f_time_remap,
         # Spatial
         "resize": _f_resize,
         "crop": _f_crop,
@@ -1433,6 +1652,7 @@ def _get_dispatch() -> dict:
         "lens_correction": _f_lens_correction,
         "deinterlace": _f_deinterlace,
         "frame_interpolation": _f_frame_interpolation,
+        "frame_rate_interpolation": _f_frame_interpolation,
         "scroll": _f_scroll,
         "aspect": _f_aspect,
         "perspective": _f_perspective,
@@ -1445,6 +1665,7 @@ def _get_dispatch() -> dict:
         "saturation": _f_saturation,
         "hue": _f_hue,
         "sharpen": _f_sharpen,
+        "colorbalance": _f_colorbalance,
         "blur": _f_blur,
         "denoise": _f_denoise,
         "vignette": _f_vignette,
@@ -1477,6 +1698,7 @@ def _get_dispatch() -> dict:
         # Audio
         "volume": _f_volume,
         "normalize": _f_normalize,
+        "pitch": _f_pitch,
         "fade_audio": _f_fade_audio,
         "remove_audio": _f_remove_audio,
         "extract_audio": _f_extract_audio,
@@ -109,6 +109,9 @@ class HandlerContext(TypedDict, total=False):
     _input_height: int
     """Height of the primary video in pixels."""
 
+    _input_sample_rate: int
+    """Sample rate of the primary audio stream in Hz."""
+
     _xfade_duration: float
     """Transition duration used by xfade (for offset calculation)."""
 
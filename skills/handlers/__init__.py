@@ -3,6 +3,7 @@
 from .audio import (  # noqa: F401
     _f_volume,
     _f_normalize,
+    _f_pitch,
     _f_fade_audio,
     _f_remove_audio,
     _f_extract_audio,
@@ -115,6 +116,8 @@ from .temporal import (  # noqa: F401
     _f_boomerang,
     _f_jump_cut,
     _f_beat_sync,
+    _f_scene_detect,
+    _f_time_remap,
 )
 
 from .visual import (  # noqa: F401
@@ -123,6 +126,7 @@ from .visual import (  # noqa: F401
     _f_saturation,
     _f_hue,
     _f_sharpen,
+    _f_colorbalance,
     _f_blur,
     _f_denoise,
     _f_vignette,
@@ -5,14 +5,143 @@ try:
 except ImportError:
     from skills.handler_contract import make_result
 
+import functools
+import json
+import logging
+import math
+import os
+import subprocess
+
+logger = logging.getLogger("ffmpega")
+
+# Targets shared by every normalize engine so they land at the same level
+# as plain ``loudnorm`` (ffmpeg's own defaults).
+_LOUDNORM_I = -24.0
+_LOUDNORM_TP = -2.0
+_LOUDNORM_LRA = 7.0
+
+
+# Upper bound for the analysis pass, which runs while the command is being
+# composed; longer inputs fall back to single-pass loudnorm.
+_MEASURE_TIMEOUT = 120
+
+
+@functools.lru_cache(maxsize=64)
+def _measure_loudness_cached(path, mtime_ns, size):
+    """Run an audio-only ``loudnorm`` analysis pass and parse its stats.
+
+    Video and subtitle streams are dropped (``-vn -sn``) so only the audio
+    is decoded. Keyed on mtime/size so a re-render of the same file never
+    measures twice. Returns ``None`` on timeout or any other failure.
+    """
+    try:
+        from ...core.bin_paths import get_ffmpeg_bin
+    except ImportError:
+        from core.bin_paths import get_ffmpeg_bin
+
+    af = (
+        f"loudnorm=I={_LOUDNORM_I}:TP={_LOUDNORM_TP}:LRA={_LOUDNORM_LRA}"
+        ":print_format=json"
+    )
+    cmd = [
+        get_ffmpeg_bin(), "-hide_banner", "-nostdin", "-nostats",
+        "-i", path, "-vn", "-sn", "-af", af, "-f", "null", "-",
+    ]
+    try:
+        result = subprocess.run(
+            cmd, capture_output=True, text=True, timeout=_MEASURE_TIMEOUT,
+        )
+    except subprocess.TimeoutExpired:
+        logger.warning(
+            "loudnorm measurement exceeded %ss; using single-pass loudnorm",
+            _MEASURE_TIMEOUT,
+        )
+        return None
+    except Exception as e:
+        logger.warning(f"loudnorm measurement failed: {e}")
+        return None
+    try:
+        stderr = result.stderr or ""
+        # loudnorm prints its JSON block at the end of stderr
+        json_start = stderr.rfind("{")
+        json_end = stderr.rfind("}") + 1
+        if json_start < 0 or json_end <= json_start:
+            return None
+        stats = json.loads(stderr[json_start:json_end])
+        # Silent input reports -inf, which no gain can fix
+        if not math.isfinite(float(stats["input_i"])):
+            return None
+        return stats
+    except (ValueError, KeyError, TypeError) as e:
+        logger.warning(f"loudnorm measurement could not be parsed: {e}")
+        return None
+
+
+def _measure_loudness(path):
+    """Measure EBU R128 loudness of *path*, or ``None`` if unavailable."""
+    if not path:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return _measure_loudness_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
 def _f_volume(p):
     return make_result(af=[f"volume={p.get('level', 1.0)}"])
 
 
 def _f_normalize(p):
+    """Normalize loudness with the selected engine.
+
+    ``loudnorm_1pass`` (default) is ffmpeg's dynamic single-pass mode and
+    needs no measurement. ``loudnorm_2pass`` and ``static_gain`` run one
+    audio-only measurement first; ``static_gain`` then renders with a plain
+    ``volume`` filter, which is far cheaper than loudnorm's limiter and
+    upsampling, unless that gain would clip the measured true peak (it
+    then renders like ``loudnorm_2pass``). Both fall back to single-pass if measurement fails, or if
+    the audio reaching this step differs from the raw input
+    (``_audio_modified``: an earlier audio step, or a trim/map anywhere
+    in the pipeline).
+    """
+    engine = p.get("engine", "loudnorm_1pass")
+    if engine in ("loudnorm_2pass", "static_gain") and not p.get("_audio_modified"):
+        stats = _measure_loudness(p.get("_input_path"))
+        if stats is not None:
+            if engine == "static_gain":
+                gain = _LOUDNORM_I - float(stats["input_i"])
+                # A plain gain has no limiter: if it would push the true
+                # peak past the ceiling, use the measured loudnorm instead.
+                if gain <= _LOUDNORM_TP - float(stats["input_tp"]):
+                    return make_result(af=[f"volume={gain:.2f}dB"])
+            return make_result(af=[
+                f"loudnorm=I={_LOUDNORM_I}:TP={_LOUDNORM_TP}:LRA={_LOUDNORM_LRA}"
+                f":measured_I={stats['input_i']}"
+                f":measured_TP={stats['input_tp']}"
+                f":measured_LRA={stats['input_lra']}"
+                f":measured_thresh={stats['input_thresh']}"
+                f":offset={stats.get('target_offset', 0)}"
+                ":linear=true"
+            ])
     return make_result(af=["loudnorm"])
 
 
+def _f_pitch(p):
+    """Shift pitch by resampling at the input's own sample rate.
+
+    The semitone ratio is resolved here so ffmpeg receives integer rates
+    instead of evaluating ``2^(x/12)``, and using the probed input rate
+    avoids a round trip through 44.1 kHz for 48/96 kHz sources.
+    """
+    semitones = float(p.get("semitones", 2))
+    sample_rate = int(p.get("_input_sample_rate") or 44100)
+    ratio = 2.0 ** (semitones / 12.0)
+    return make_result(
+        af=[f"asetrate={round(sample_rate * ratio)},aresample={sample_rate}"]
+    )
+
+
 def _f_fade_audio(p):
     fade_type = p.get("type", "in")
     start = p.get("start", 0)
@@ -1,10 +1,85 @@
 """FFMPEGA Encoding skill handlers."""
 
+import functools
+import re
+import subprocess
+
 try:
     from ..handler_contract import make_result
 except ImportError:
     from skills.handler_contract import make_result
 
+
+def _ffmpeg_bin():
+    try:
+        from ...core.bin_paths import get_ffmpeg_bin
+    except ImportError:
+        from core.bin_paths import get_ffmpeg_bin
+    return get_ffmpeg_bin()
+
+
+@functools.lru_cache(maxsize=1)
+def _available_encoders():
+    """Names of the encoders compiled into the local ffmpeg (probed once)."""
+    try:
+        result = subprocess.run(
+            [_ffmpeg_bin(), "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=30,
+        )
+    except Exception:
+        return frozenset()
+    names = set()
+    for line in result.stdout.splitlines():
+        # " V....D h264_nvenc           NVIDIA NVENC H.264 encoder"
+        parts = line.split()
+        if len(parts) >= 2 and len(parts[0]) == 6 and parts[0][0] in "VAS":
+            names.add(parts[1])
+    return frozenset(names)
+
+
+@functools.lru_cache(maxsize=1)
+def _available_filters():
+    """Names of the filters compiled into the local ffmpeg (probed once)."""
+    try:
+        result = subprocess.run(
+            [_ffmpeg_bin(), "-hide_banner", "-filters"],
+            capture_output=True, text=True, timeout=30,
+        )
+    except Exception:
+        return frozenset()
+    names = set()
+    for line in result.stdout.splitlines():
+        # " ... scale_cuda        V->V       GPU accelerated video resizer"
+        parts = line.split()
+        if len(parts) >= 3 and "->" in parts[2]:
+            names.add(parts[1])
+    return frozenset(names)
+
+
+@functools.cache
+def _encoder_works(encoder):
+    """Whether *encoder* can open on this host (compiled in != GPU present)."""
+    if encoder not in _available_encoders():
+        return False
+    try:
+        result = subprocess.run(
+            [_ffmpeg_bin(), "-hide_banner", "-loglevel", "error",
+             "-f", "lavfi", "-i", "color=s=256x256:d=0.1",
+             "-frames:v", "1", "-c:v", encoder, "-f", "null", "-"],
+            capture_output=True, timeout=30,
+        )
+    except Exception:
+        return False
+    return result.returncode == 0
+
+
+# GPU encoders tried by convert:encoder=auto, fastest first.  All accept
+# system-memory frames, so no hwupload is needed (see _HW_ENCODERS).
+_AUTO_ENCODERS = {
+    "h264": ("h264_nvenc", "h264_videotoolbox"),
+    "h265": ("hevc_nvenc", "hevc_videotoolbox"),
+}
+
 def _f_compress(p):
     preset = p.get("preset", "medium")
     crf_map = {"light": 20, "medium": 23, "heavy": 28}
@@ -14,14 +89,39 @@ def _f_compress(p):
 
 def _f_convert(p):
     codec = p.get("codec", "h264")
+    if p.get("encoder") == "auto":
+        for encoder in _AUTO_ENCODERS.get(codec, ()):
+            if _encoder_works(encoder):
+                return make_result(opts=["-c:v", encoder])
     codec_map = {"h264": "libx264", "h265": "libx265", "vp9": "libvpx-vp9", "av1": "libaom-av1"}
     return make_result(opts=["-c:v", codec_map.get(codec, "libx264")])
 
 
+_BITRATE_RE = re.compile(r"(\d+(?:\.\d+)?)([MmKk]?)")
+_BITRATE_SCALE = {"": 1, "k": 1000, "m": 1000000}
+
+
+@functools.lru_cache(maxsize=64)
+def _vbv_opts(bitrate):
+    """``-maxrate``/``-bufsize`` for a target bitrate like '4M' or '2500k'.
+
+    1.5x peak and a 2-second buffer keep x264 out of its defensive VBV
+    lookahead.  Unparseable values get no VBV constraint.
+    """
+    m = _BITRATE_RE.fullmatch(str(bitrate).strip())
+    if not m:
+        return ()
+    bps = float(m.group(1)) * _BITRATE_SCALE[m.group(2).lower()]
+    if bps <= 0:
+        return ()
+    return ("-maxrate", f"{round(bps * 1.5 / 1000)}k",
+            "-bufsize", f"{round(bps * 2 / 1000)}k")
+
+
 def _f_bitrate(p):
     opts = []
     if p.get("video"):
-        opts.extend(["-b:v", p["video"]])
+        opts.extend(["-b:v", p["video"], *_vbv_opts(p["video"])])
     if p.get("audio"):
         opts.extend(["-b:a", p["audio"]])
     return make_result(opts=opts)
@@ -30,7 +130,11 @@ def _f_bitrate(p):
 def _f_quality(p):
     crf = p.get("crf", 23)
     preset = p.get("preset", "medium")
-    return make_result(opts=["-c:v", "libx264", "-crf", str(crf), "-preset", preset])
+    opts = ["-crf", str(crf), "-preset", preset]
+    # The nodes append quality last; keep an encoder chosen earlier
+    if not p.get("_video_codec"):
+        opts[:0] = ["-c:v", "libx264"]
+    return make_result(opts=opts)
 
 
 def _f_gif(p):
@@ -50,7 +154,7 @@ def _f_container(p):
 
 def _f_two_pass(p):
     bitrate = p.get("target_bitrate", "4M")
-    return make_result(opts=["-b:v", bitrate])
+    return make_result(opts=["-b:v", bitrate, *_vbv_opts(bitrate)])
 
 
 def _f_audio_codec(p):
@@ -61,9 +165,37 @@ def _f_audio_codec(p):
     return make_result(opts=["-c:a", codec, "-b:a", bitrate])
 
 
+# Hardware encoders that accept system-memory frames, so they sit behind
+# the composer's software filter chain without an explicit hwupload.
+# VA-API/QSV encoders need format/hwupload filters in the graph, so those
+# types only accelerate decoding.  -hwaccel_output_format is deliberately
+# not set: decoded frames must come back to system memory for CPU filters
+# (the composer adds it only for all-GPU CUDA -> NVENC jobs).
+_HW_ENCODERS = {
+    ("cuda", "h264"): "h264_nvenc",
+    ("cuda", "h265"): "hevc_nvenc",
+    ("videotoolbox", "h264"): "h264_videotoolbox",
+    ("videotoolbox", "h265"): "hevc_videotoolbox",
+}
+
+# (input_options, output_options) for every (type, codec) pair, built once.
+_HWACCEL_ARGS = {
+    (accel, codec): (
+        ("-hwaccel", accel),
+        ("-c:v", _HW_ENCODERS[accel, codec]) if (accel, codec) in _HW_ENCODERS else (),
+    )
+    for accel in ("auto", "cuda", "vaapi", "qsv", "videotoolbox")
+    for codec in ("none", "h264", "h265")
+}
+
+
 def _f_hwaccel(p):
     accel_type = p.get("type", "auto")
-    return make_result(io=["-hwaccel", accel_type])
+    args = _HWACCEL_ARGS.get((accel_type, p.get("codec", "none")))
+    if args is None:
+        return make_result(io=["-hwaccel", accel_type])
+    io, opts = args
+    return make_result(io=list(io), opts=list(opts))
 
 
 def _f_thumbnail(p):
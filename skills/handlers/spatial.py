@@ -168,6 +168,10 @@ def _f_deinterlace(p):
 def _f_frame_interpolation(p):
     fps = int(p.get("fps", 60))
     mode = p.get("mode", "mci")
+    if mode == "dup":
+        # minterpolate's dup mode is nearest-frame repeat, which is what
+        # fps already does without the per-frame interpolation machinery.
+        return make_result(vf=[f"fps={fps}"])
     return make_result(vf=[f"minterpolate=fps={fps}:mi_mode={mode}"])
 
 
@@ -2,8 +2,24 @@
 
 try:
     from ..handler_contract import make_result
+    from .encoding import _available_filters
 except ImportError:
     from skills.handler_contract import make_result
+    from skills.handlers.encoding import _available_filters
+
+
+def _seconds(value):
+    """Seconds from a number or an ``[[HH:]MM:]SS[.frac]`` timestamp.
+
+    Raises ValueError/TypeError for anything else.
+    """
+    if isinstance(value, str) and ":" in value:
+        total = 0.0
+        for part in value.strip().split(":"):
+            total = total * 60 + float(part)
+        return total
+    return float(value)
+
 
 def _f_trim(p):
     input_opts = []
@@ -14,14 +30,15 @@ def _f_trim(p):
     duration = p.get("duration")
 
     try:
-        # Try to parse start/end as floats for calculation (fast seek optimization)
-        s_val = float(start) if start is not None else 0.0
+        # Try to parse start/end as seconds for calculation (fast seek
+        # optimization); HH:MM:SS timestamps qualify too.
+        s_val = _seconds(start) if start is not None else 0.0
 
         if start is not None:
             input_opts.extend(["-ss", str(start)])
 
         if end is not None:
-            e_val = float(end)
+            e_val = _seconds(end)
             # Duration is end - start
             output_opts.extend(["-t", str(e_val - s_val)])
         elif duration is not None:
@@ -29,7 +46,7 @@ def _f_trim(p):
             output_opts.extend(["-t", str(duration)])
 
     except (ValueError, TypeError):
-        # Fallback to slow seek if we can't do math (e.g. strings like "00:01:00")
+        # Fallback to slow seek if we can't do math (unparseable strings)
         opts = []
         if start: opts.extend(["-ss", str(start)])
         if end: opts.extend(["-to", str(end)])
@@ -46,6 +63,10 @@ def _f_speed(p):
     af = []
     if 0.5 <= factor <= 2.0:
         af.append(f"atempo={factor}")
+    elif "rubberband" in _available_filters():
+        # One rubberband pass instead of a chain of atempo stages, each of
+        # which re-runs WSOLA over the whole stream.
+        af.append(f"rubberband=tempo={factor}")
     elif factor < 0.5:
         remaining = factor
         while remaining < 0.5:
@@ -62,6 +83,27 @@ def _f_speed(p):
     return make_result(vf=vf, af=af)
 
 
+def _f_scene_detect(p):
+    threshold = p.get("threshold", 0.3)
+    vf = [f"select='gt(scene,{threshold})',setpts=N/FRAME_RATE/TB"]
+    if p.get("keyframes_only") is True:
+        # Decoder drops non-keyframes before they are decoded, so the scene
+        # score only runs on the keyframe set.
+        return make_result(vf=vf, io=["-skip_frame", "nokey"])
+    return make_result(vf=vf)
+
+
+def _f_time_remap(p):
+    start = float(p.get("start_speed", 1.0))
+    end = float(p.get("end_speed", 0.25))
+    # Ramp across the real clip length (5 s when unknown).  The slope is
+    # folded into one constant so setpts evaluates a single multiply-add
+    # per frame.
+    duration = float(p.get("_video_duration") or 5)
+    slope = (end - start) / duration if duration > 0 else 0.0
+    return make_result(vf=[f"setpts=PTS/clip({start:g}{slope:+.6g}*T\\,0.1\\,10)"])
+
+
 def _f_reverse(p):
     return make_result(vf=["reverse"], af=["areverse"])
 
@@ -30,6 +30,23 @@ def _f_hue(p):
     return make_result(vf=[f"hue=h={p.get('value', 0)}"])
 
 
+def _f_colorbalance(p):
+    # Zero is colorbalance's default, so zero options are dropped and an
+    # all-zero balance emits no filter (and no per-pixel pass) at all.
+    opts = []
+    for key in ("rs", "gs", "bs", "rm", "gm", "bm"):
+        value = p.get(key, 0)
+        try:
+            if float(value) == 0:
+                continue
+        except (TypeError, ValueError):
+            pass
+        opts.append(f"{key}={value}")
+    if not opts:
+        return make_result()
+    return make_result(vf=["colorbalance=" + ":".join(opts)])
+
+
 def _f_sharpen(p):
     amount = p.get("amount", 1.0)
     return make_result(vf=[f"unsharp=5:5:{amount}:5:5:0"])
@@ -40,10 +57,16 @@ def _f_blur(p):
     return make_result(vf=[f"boxblur={radius}:{radius}"])
 
 
+_DENOISE_PRESETS = {
+    "light": "hqdn3d=2:2:3:3",
+    "medium": "hqdn3d=4:3:6:4",
+    "strong": "hqdn3d=6:4:9:6",
+}
+
+
 def _f_denoise(p):
     strength = p.get("strength", "medium")
-    m = {"light": "hqdn3d=2:2:3:3", "medium": "hqdn3d=4:3:6:4"}
-    return make_result(vf=[m.get(strength, "hqdn3d=6:4:9:6")])
+    return make_result(vf=[_DENOISE_PRESETS.get(strength, _DENOISE_PRESETS["strong"])])
 
 
 def _f_vignette(p):
@@ -328,6 +351,11 @@ _EDIT_TONE_MAP = {
     "thermal":   _THERMAL_PSEUDOCOLOR,
 }
 
+# One word-boundary alternation per map, so the edit fallback scans the
+# prompt once per map instead of compiling a regex per keyword.
+_EDIT_COLOR_RE = re.compile(r"\b(" + "|".join(map(re.escape, _EDIT_COLOR_MAP)) + r")\b")
+_EDIT_TONE_RE = re.compile(r"\b(" + "|".join(map(re.escape, _EDIT_TONE_MAP)) + r")\b")
+
 
 def _f_comic_book_enhanced(p):
     """Comic book with real edge outline + posterization (filter_complex)."""
@@ -960,17 +988,20 @@ def _edit_ffmpeg_fallback(edit_prompt: str, strength: int, mask_path: str, inver
     # to avoid false positives like "sacred" matching "red").
     fx_filter = None
 
-    # Check color keywords first (more specific)
+    # Check color keywords first (more specific).  Keywords are whole
+    # words, so findall sees every one present; map order picks the winner.
+    found = set(_EDIT_COLOR_RE.findall(prompt_lower))
     for keyword, filt in _EDIT_COLOR_MAP.items():
-        if re.search(r'\b' + re.escape(keyword) + r'\b', prompt_lower):
+        if keyword in found:
             fx_filter = filt
             log.info("edit fallback: matched color keyword '%s' → %s", keyword, filt)
             break
 
     # Then check tonal keywords
     if fx_filter is None:
+        found = set(_EDIT_TONE_RE.findall(prompt_lower))
         for keyword, filt in _EDIT_TONE_MAP.items():
-            if re.search(r'\b' + re.escape(keyword) + r'\b', prompt_lower):
+            if keyword in found:
                 fx_filter = filt
                 log.info("edit fallback: matched tone keyword '%s' → %s", keyword, filt)
                 break
@@ -1,13 +1,111 @@
 """Skill registry for managing available editing skills."""
 
 import copy
+import itertools
 import logging
+import math
+import re
+import sys
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional, Any
 
 logger = logging.getLogger("ffmpega")
 
+# Shared across registry instances so a version number is never reused,
+# which makes it safe as a key for module-level memoization.
+_version_counter = itertools.count(1)
+
+# ``{name}`` placeholders in ffmpeg_template strings.  Matched literally
+# (no format-spec grammar) so custom YAML templates never fail to parse.
+_PLACEHOLDER_RE = re.compile(r"\{([^{}]*)\}")
+
+_HEX_COLOR_RE = re.compile(r"^#[0-9A-Fa-f]{6}$")
+
+
+def _compile_template(template: str) -> tuple[tuple[str, str | None], ...]:
+    """Split an ``ffmpeg_template`` into ``(literal, field)`` segments.
+
+    *field* is the placeholder name following *literal*, or ``None`` for
+    the trailing literal.
+    """
+    parts = _PLACEHOLDER_RE.split(template)
+    segments = [(parts[i], parts[i + 1]) for i in range(0, len(parts) - 1, 2)]
+    segments.append((parts[-1], None))
+    return tuple(segments)
+
+
+# Canonical SkillParameter / choices instances.  Many skills declare the
+# same parameter (font color, fade duration, intensity presets...), so
+# identical definitions are collapsed to one shared, read-only object.
+_PARAM_INTERN: dict[tuple, "SkillParameter"] = {}
+_CHOICES_INTERN: dict[tuple, list[str]] = {}
+
+
+def _intern_parameter(param: "SkillParameter") -> "SkillParameter":
+    """Return the canonical instance for an identical parameter definition.
+
+    Parameters with unhashable defaults are returned unchanged.
+    """
+    choices = tuple(param.choices) if param.choices else None
+    # Value types are part of the key: 5 == 5.0 but they render differently
+    key = (
+        param.name, param.type, param.description, param.required,
+        param.default, type(param.default),
+        param.min_value, type(param.min_value),
+        param.max_value, type(param.max_value),
+        choices, tuple(param.aliases) if param.aliases else None,
+    )
+    try:
+        canonical = _PARAM_INTERN.get(key)
+    except TypeError:
+        return param
+    if canonical is None:
+        # SkillParameter is frozen; these rebinds happen before it is shared
+        object.__setattr__(param, "name", sys.intern(param.name))
+        if choices is not None:
+            object.__setattr__(
+                param, "choices", _CHOICES_INTERN.setdefault(choices, param.choices),
+            )
+        canonical = _PARAM_INTERN[key] = param
+    return canonical
+
+
+def _fill_segments(
+    segments: tuple[tuple[str, str | None], ...],
+    params: dict,
+    param_map: dict,
+    escape: Callable[[str], str] | None = None,
+) -> str:
+    """Join pre-parsed template segments, filling each placeholder.
+
+    Values come from *params*, then parameter defaults in *param_map*;
+    anything unresolved is left as literal ``{name}``.
+    """
+    if len(segments) == 1:
+        # No placeholders (e.g. "areverse") — nothing to fill
+        return segments[0][0]
+    buf: list[str] = []
+    append = buf.append
+    for literal, name in segments:
+        append(literal)
+        if name is None:
+            continue
+        if name in params:
+            value = params[name]
+            val_str = str(value)
+            if escape is not None and isinstance(value, str):
+                val_str = escape(val_str)
+            append(val_str)
+        else:
+            param = param_map.get(name)
+            if param is not None and param.default is not None:
+                append(str(param.default))
+            else:
+                append(f"{{{name}}}")
+    return "".join(buf)
+
 
 class SkillCategory(str, Enum):
     """Categories of skills."""
@@ -32,9 +130,12 @@ class ParameterType(str, Enum):
     COLOR = "color"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SkillParameter:
-    """Definition of a skill parameter."""
+    """Definition of a skill parameter.
+
+    Frozen because identical definitions are shared between skills.
+    """
     name: str
     type: ParameterType
     description: str
@@ -42,12 +143,27 @@ class SkillParameter:
     default: Any = None
     min_value: float | None = None
     max_value: float | None = None
-    choices: list[str] | None = None
+    # Literal tuples are accepted (constant-folded at the call site) and
+    # stored as a list so error text and the JSON schema are unchanged.
+    choices: list[str] | tuple[str, ...] | None = None
     aliases: list[str] | None = None
     _choice_map: dict[str, str] = field(init=False, repr=False, default_factory=dict)
+    # min/max with None mapped to -inf/+inf so range checks are one chained compare
+    _lo: float = field(init=False, repr=False, compare=False, default=-math.inf)
+    _hi: float = field(init=False, repr=False, compare=False, default=math.inf)
 
     def __post_init__(self):
         """Pre-compute choice map for faster validation."""
+        if self.choices:
+            # Interned like skill names: YAML choices are parsed strings,
+            # and the values end up as _choice_map keys.
+            object.__setattr__(self, "choices", [
+                sys.intern(c) if isinstance(c, str) else c for c in self.choices
+            ])
+        if self.min_value is not None:
+            object.__setattr__(self, "_lo", self.min_value)
+        if self.max_value is not None:
+            object.__setattr__(self, "_hi", self.max_value)
         if self.type == ParameterType.CHOICE and self.choices:
             for c in self.choices:
                 # Exact match
@@ -60,6 +176,12 @@ class SkillParameter:
                     self._choice_map[normalized] = c
                     self._choice_map[normalized.lower()] = c
 
+    def _range_error(self, value: Any) -> str:
+        """Error message for a numeric value outside ``[min, max]``."""
+        if value < self._lo:
+            return f"Parameter '{self.name}' must be >= {self.min_value}"
+        return f"Parameter '{self.name}' must be <= {self.max_value}"
+
     def validate(self, value: Any) -> tuple[bool, Optional[str]]:
         """Validate a parameter value.
 
@@ -77,42 +199,32 @@ class SkillParameter:
         if self.type == ParameterType.INT:
             if not isinstance(value, int):
                 return False, f"Parameter '{self.name}' must be an integer"
-            min_val = self.min_value
-            max_val = self.max_value
-            if min_val is not None and value < min_val:
-                return False, f"Parameter '{self.name}' must be >= {min_val}"
-            if max_val is not None and value > max_val:
-                return False, f"Parameter '{self.name}' must be <= {max_val}"
+            if not self._lo <= value <= self._hi:
+                return False, self._range_error(value)
 
         elif self.type == ParameterType.FLOAT:
             if not isinstance(value, (int, float)):
                 return False, f"Parameter '{self.name}' must be a number"
-            min_val = self.min_value
-            max_val = self.max_value
-            if min_val is not None and value < min_val:
-                return False, f"Parameter '{self.name}' must be >= {min_val}"
-            if max_val is not None and value > max_val:
-                return False, f"Parameter '{self.name}' must be <= {max_val}"
+            if not self._lo <= value <= self._hi:
+                return False, self._range_error(value)
 
         elif self.type == ParameterType.STRING:
             if not isinstance(value, str):
                 return False, f"Parameter '{self.name}' must be a string"
-            min_val = self.min_value
-            max_val = self.max_value
-            if min_val is not None and len(value) < min_val:
-                return False, f"Parameter '{self.name}' must be at least {int(min_val)} characters"
-            if max_val is not None and len(value) > max_val:
-                return False, f"Parameter '{self.name}' must be at most {int(max_val)} characters"
+            length = len(value)
+            if length < self._lo:
+                return False, f"Parameter '{self.name}' must be at least {int(self.min_value)} characters"
+            if length > self._hi:
+                return False, f"Parameter '{self.name}' must be at most {int(self.max_value)} characters"
 
         elif self.type == ParameterType.BOOL:
             if not isinstance(value, bool):
                 return False, f"Parameter '{self.name}' must be a boolean"
 
         elif self.type == ParameterType.COLOR:
-            import re
             if not isinstance(value, str):
                 return False, f"Parameter '{self.name}' must be a color string"
-            if not re.match(r"^#[0-9A-Fa-f]{6}$", value):
+            if not _HEX_COLOR_RE.match(value):
                 return False, f"Parameter '{self.name}' must be a hex color like #RRGGBB"
 
         elif self.type == ParameterType.CHOICE:
@@ -149,7 +261,7 @@ class SkillParameter:
         return True, None
 
 
-@dataclass
+@dataclass(slots=True)
 class Skill:
     """Definition of an editing skill."""
     name: str
@@ -158,20 +270,43 @@ class Skill:
     parameters: list[SkillParameter] = field(default_factory=list)
     ffmpeg_template: Optional[str] = None
     pipeline: Optional[list[str]] = None
-    examples: list[str] = field(default_factory=list)
-    tags: list[str] = field(default_factory=list)
+    # Only read when the prompt block is first rendered (or by skill-info
+    # tools), so they are held as a compact immutable tuple.
+    examples: tuple[str, ...] = ()
+    tags: tuple[str, ...] = ()
+    # Max concurrent ffmpeg processes this skill tolerates in batch mode.
+    # >1 only for I/O-bound stream-copy skills; CPU-bound skills keep 1.
+    batch_parallel: int = 1
     _search_text: str = field(init=False, repr=False, default="")
     _param_map: dict[str, SkillParameter] = field(init=False, repr=False, default_factory=dict)
     _alias_map: dict[str, str] = field(init=False, repr=False, default_factory=dict)
+    _param_names: frozenset[str] = field(init=False, repr=False, default=frozenset())
+    _prompt_str: str = field(init=False, repr=False, default="")
+    _category_title: str = field(init=False, repr=False, default="")
+    _template_source: str | None = field(init=False, repr=False, default=None)
+    _template_segments: tuple[tuple[str, str | None], ...] = field(
+        init=False, repr=False, default=(),
+    )
+    _pipeline_source: list[str] | None = field(init=False, repr=False, default=None)
+    _pipeline_segments: tuple[tuple[tuple[str, str | None], ...], ...] = field(
+        init=False, repr=False, default=(),
+    )
+    # Extra names declared by a YAML custom skill, registered by the loader
+    _yaml_aliases: list[str] = field(init=False, repr=False, default_factory=list)
 
     def __post_init__(self):
         """Pre-compute search text and parameter maps for faster lookups."""
-        # Ensure tags is a list even if initialized with None
-        tags = self.tags if self.tags is not None else []
-        parts = [str(self.name), str(self.description)] + tags
+        # Ensure tags is a tuple even if initialized with None.  Names and
+        # tags are interned: literals already are, but YAML-loaded skills
+        # parse fresh strings, and these are used as dict/index keys.
+        self.name = sys.intern(self.name)
+        self.tags = tuple(sys.intern(t) for t in self.tags or ())
+        self.examples = tuple(self.examples or ())
+        parts = [str(self.name), str(self.description), *self.tags]
         self._search_text = " ".join(parts).lower()
 
-        # Build parameter maps
+        # Build parameter maps over shared parameter instances
+        self.parameters = [_intern_parameter(p) for p in self.parameters]
         self._param_map = {}
         self._alias_map = {}
         for p in self.parameters:
@@ -179,6 +314,20 @@ class Skill:
             if p.aliases:
                 for alias in p.aliases:
                     self._alias_map[alias] = p.name
+        if self._param_map:
+            self._param_names = frozenset(self._param_map)
+
+        self._category_title = self.category.value.title()
+
+        # Pre-parse the template so rendering is a join, not a re-scan
+        if self.ffmpeg_template:
+            self._template_segments = _compile_template(self.ffmpeg_template)
+            self._template_source = self.ffmpeg_template
+        if self.pipeline:
+            self._pipeline_segments = tuple(
+                _compile_template(step) for step in self.pipeline
+            )
+            self._pipeline_source = self.pipeline
 
     def validate_params(self, params: dict) -> tuple[bool, list[str]]:
         """Validate parameters for this skill.
@@ -206,6 +355,78 @@ class Skill:
         """Get a parameter definition by name."""
         return self._param_map.get(name)
 
+    def render_template(
+        self,
+        params: dict,
+        escape: Callable[[str], str] | None = None,
+    ) -> str:
+        """Render ``ffmpeg_template`` from its pre-parsed segments.
+
+        Placeholders are filled from *params* first, then from parameter
+        defaults; anything still unresolved is left as literal ``{name}``.
+
+        Args:
+            params: Parameter values keyed by name.
+            escape: Optional callable applied to string values (e.g.
+                ``sanitize_text_param``).
+
+        Returns:
+            The rendered template, or an empty string if the skill has none.
+        """
+        template = self.ffmpeg_template
+        if not template:
+            return ""
+        if self._template_source is not template:
+            # Template was reassigned after construction
+            self._template_segments = _compile_template(template)
+            self._template_source = template
+        return _fill_segments(self._template_segments, params, self._param_map, escape)
+
+    def render_pipeline(self, params: dict) -> list[str]:
+        """Render each ``pipeline`` step string like :meth:`render_template`.
+
+        Args:
+            params: Parameter values keyed by name.
+
+        Returns:
+            The rendered step strings, or an empty list if the skill has none.
+        """
+        pipeline = self.pipeline
+        if not pipeline:
+            return []
+        if self._pipeline_source is not pipeline:
+            self._pipeline_segments = tuple(_compile_template(s) for s in pipeline)
+            self._pipeline_source = pipeline
+        param_map = self._param_map
+        return [
+            _fill_segments(segments, params, param_map)
+            for segments in self._pipeline_segments
+        ]
+
+    def _get_prompt_block(self) -> str:
+        """Return this skill's LLM prompt block, rendering it on first use.
+
+        Deferred until a prompt is actually built, so runs that only look
+        skills up (no-LLM modes, batch replays) never pay for the strings.
+        """
+        if not self._prompt_str:
+            lines = [f"### {self.name}", f"{self.description}\n"]
+
+            if self.parameters:
+                lines.append("Parameters:")
+                for param in self.parameters:
+                    req = "required" if param.required else f"optional, default={param.default}"
+                    lines.append(f"  - {param.name} ({param.type.value}): {param.description} [{req}]")
+
+            if self.examples:
+                lines.append("Examples:")
+                for ex in self.examples:
+                    lines.append(f"  - {ex}")
+
+            lines.append("")
+            self._prompt_str = "\n".join(lines)
+        return self._prompt_str
+
 
 class SkillRegistry:
     """Central registry for all available skills."""
@@ -215,9 +436,25 @@ class SkillRegistry:
         self._by_category: dict[SkillCategory, list[Skill]] = {
             cat: [] for cat in SkillCategory
         }
-        self._by_tag: dict[str, list[str]] = {}
+        self._by_tag: dict[str, list[Skill]] = {}
         self._cached_prompt_string: Optional[str] = None
+        self._cached_prompt_chunks: list[tuple[str, str]] | None = None
         self._cached_json_schema: Optional[dict] = None
+        # Set once the built-in skills are in; repeat calls are no-ops
+        self._defaults_registered = False
+        # Built-in skills as first registered here, restored on reload()
+        # instead of constructing ~200 Skill objects again.  Kept per
+        # registry so no two registries share (mutable) Skill instances.
+        self._default_snapshot: tuple[
+            dict[str, Skill], dict[SkillCategory, list[Skill]], dict[str, list[Skill]],
+        ] | None = None
+        # Bumped on every mutation so callers can key derived caches on it
+        self._version: int = next(_version_counter)
+
+    @property
+    def version(self) -> int:
+        """Globally unique token that changes whenever the registry changes."""
+        return self._version
 
     def register(self, skill: Skill) -> None:
         """Register a skill.
@@ -225,6 +462,23 @@ class SkillRegistry:
         Args:
             skill: Skill to register.
         """
+        self._add(skill)
+        self._invalidate()
+
+    def register_many(self, skills: Iterable[Skill]) -> None:
+        """Register several skills, invalidating caches only once.
+
+        Equivalent to calling :meth:`register` for each skill in order.
+
+        Args:
+            skills: Skills to register.
+        """
+        for skill in skills:
+            self._add(skill)
+        self._invalidate()
+
+    def _add(self, skill: Skill) -> None:
+        """Index *skill*, replacing any existing skill of the same name."""
         if skill.name in self._skills:
             old = self._skills[skill.name]
             cat_list = self._by_category[old.category]
@@ -233,19 +487,23 @@ class SkillRegistry:
             for old_tag in old.tags:
                 if old_tag in self._by_tag:
                     self._by_tag[old_tag] = [
-                        n for n in self._by_tag[old_tag] if n != skill.name
+                        s for s in self._by_tag[old_tag] if s.name != skill.name
                     ]
+        skill._prompt_str = ""
         self._skills[skill.name] = skill
         self._by_category[skill.category].append(skill)
 
         for tag in skill.tags:
             if tag not in self._by_tag:
                 self._by_tag[tag] = []
-            self._by_tag[tag].append(skill.name)
+            self._by_tag[tag].append(skill)
 
-        # Invalidate cache
+    def _invalidate(self) -> None:
+        """Drop derived caches and bump the registry version."""
         self._cached_prompt_string = None
+        self._cached_prompt_chunks = None
         self._cached_json_schema = None
+        self._version = next(_version_counter)
 
     def register_alias(self, alias: str, target_name: str) -> None:
         """Register an alias that maps to an existing skill.
@@ -254,23 +512,25 @@ class SkillRegistry:
             alias: The alias name.
             target_name: The name of the existing skill to alias.
         """
-        import copy
         skill = self._skills.get(target_name)
         if skill is None:
             return
+        # Registry keys are interned like Skill names (YAML aliases are
+        # parsed strings), so hits on literal lookups compare by identity
+        alias = sys.intern(alias)
         alias_skill = copy.copy(skill)
         alias_skill.name = alias
         alias_skill._search_text = " ".join(
-            [alias, skill.description] + (skill.tags or [])
+            [alias, skill.description, *skill.tags]
         ).lower()
+        alias_skill._prompt_str = ""
         self._skills[alias] = alias_skill
         self._by_category[alias_skill.category].append(alias_skill)
         for tag in alias_skill.tags:
             if tag not in self._by_tag:
                 self._by_tag[tag] = []
-            self._by_tag[tag].append(alias)
-        self._cached_prompt_string = None
-        self._cached_json_schema = None
+            self._by_tag[tag].append(alias_skill)
+        self._invalidate()
 
     def get(self, name: str) -> Optional[Skill]:
         """Get a skill by name.
@@ -311,7 +571,7 @@ class SkillRegistry:
         Returns:
             List of skills with the tag.
         """
-        return [self._skills[name] for name in self._by_tag.get(tag, [])]
+        return list(self._by_tag.get(tag, []))
 
     def search(self, query: str) -> list[Skill]:
         """Search for skills by name or description.
@@ -335,42 +595,46 @@ class SkillRegistry:
             if any(w in skill._search_text for w in words)
         ]
 
-    def to_prompt_string(self) -> str:
-        """Generate a string representation for LLM prompts.
+    def iter_prompt_chunks(self) -> Iterator[tuple[str, str]]:
+        """Yield the LLM prompt description as per-category chunks.
 
-        Returns:
-            Formatted string describing all skills.
-        """
-        if self._cached_prompt_string is not None:
-            return self._cached_prompt_string
+        Each item is ``(category_name, chunk_text)``.  The first chunk is
+        the section header and has an empty category name.  Joining all
+        chunk texts reproduces :meth:`to_prompt_string` exactly, so callers
+        that send block-structured content can emit one block per category.
 
-        lines = ["# Available Skills\n"]
+        Yields:
+            Tuples of (category value, rendered chunk text).
+        """
+        if self._cached_prompt_chunks is None:
+            chunks = [("", "# Available Skills\n")]
 
-        for category in list(SkillCategory):
-            skills = self.list_by_category(category)
-            if not skills:
-                continue
+            for category in list(SkillCategory):
+                skills = self._by_category.get(category)
+                if not skills:
+                    continue
 
-            lines.append(f"\n## {category.value.title()}\n")
+                lines = ["", f"\n## {skills[0]._category_title}\n"]
+                # ⚡ Perf: per-skill blocks are memoized on the skill
+                lines.extend(skill._get_prompt_block() for skill in skills)
+                chunks.append((category.value, "\n".join(lines)))
 
-            for skill in skills:
-                lines.append(f"### {skill.name}")
-                lines.append(f"{skill.description}\n")
+            self._cached_prompt_chunks = chunks
 
-                if skill.parameters:
-                    lines.append("Parameters:")
-                    for param in skill.parameters:
-                        req = "required" if param.required else f"optional, default={param.default}"
-                        lines.append(f"  - {param.name} ({param.type.value}): {param.description} [{req}]")
+        yield from self._cached_prompt_chunks
 
-                if skill.examples:
-                    lines.append("Examples:")
-                    for ex in skill.examples:
-                        lines.append(f"  - {ex}")
+    def to_prompt_string(self) -> str:
+        """Generate a string representation for LLM prompts.
 
-                lines.append("")
+        Returns:
+            Formatted string describing all skills.
+        """
+        if self._cached_prompt_string is not None:
+            return self._cached_prompt_string
 
-        self._cached_prompt_string = "\n".join(lines)
+        self._cached_prompt_string = "".join(
+            text for _category, text in self.iter_prompt_chunks()
+        )
         return self._cached_prompt_string
 
     def to_json_schema(self) -> dict:
@@ -480,8 +744,8 @@ class SkillRegistry:
         for cat_list in self._by_category.values():
             cat_list.clear()
         self._by_tag.clear()
-        self._cached_prompt_string = None
-        self._cached_json_schema = None
+        self._defaults_registered = False
+        self._invalidate()
 
         # Re-register defaults
         _register_default_skills(self)
@@ -620,7 +884,37 @@ def get_registry() -> SkillRegistry:
 
 
 def _register_default_skills(registry: SkillRegistry) -> None:
-    """Register all default skills."""
+    """Register all default skills (once per registry until reload).
+
+    Built-in skills live in Python modules that hot-reload never
+    re-imports, so an empty registry that has registered them before
+    restores its own snapshot rather than rebuilding them.
+    """
+    if registry._defaults_registered:
+        return
+    registry._defaults_registered = True
+    if not registry._skills:
+        if registry._default_snapshot is not None:
+            skills, by_category, by_tag = registry._default_snapshot
+            registry._skills.update(skills)
+            for category, cat_skills in by_category.items():
+                registry._by_category[category].extend(cat_skills)
+            for tag, tag_skills in by_tag.items():
+                registry._by_tag[tag] = list(tag_skills)
+            registry._invalidate()
+            return
+        _register_default_skill_modules(registry)
+        registry._default_snapshot = (
+            dict(registry._skills),
+            {c: list(v) for c, v in registry._by_category.items()},
+            {t: list(v) for t, v in registry._by_tag.items()},
+        )
+        return
+    _register_default_skill_modules(registry)
+
+
+def _register_default_skill_modules(registry: SkillRegistry) -> None:
+    """Run every built-in category module's ``register_skills``."""
     from .category import temporal, spatial, visual, audio, encoding, ai_visual
     from .outcome import cinematic, vintage, social, effects, creative, transitions, motion, delivery
 
@@ -117,7 +117,7 @@ def load_skill_from_yaml(path: Path) -> Optional[Skill]:
     if isinstance(params_raw, dict):
         for pname, pdata in params_raw.items():
             if isinstance(pdata, dict):
-                parameters.append(_parse_parameter(pname, pdata))
+                parameters.append(_parse_parameter(str(pname), pdata))
 
     # Template / pipeline
     ffmpeg_template = data.get("ffmpeg_template")
@@ -146,7 +146,7 @@ def load_skill_from_yaml(path: Path) -> Optional[Skill]:
     )
 
     # Stash aliases for the registry to register later.
-    skill._yaml_aliases = aliases  # type: ignore[attr-defined]
+    skill._yaml_aliases = aliases
     return skill
 
 
@@ -314,6 +314,24 @@ class TestFluxKleinToggle:
         fc = result.filter_complex if hasattr(result, 'filter_complex') else result[2]
         assert fc, f"Expected filter_complex for keyword '{keyword}'"
 
+    def test_edit_fallback_keyword_priority(self):
+        """Map order wins over prompt order; substrings don't match."""
+        from skills.handlers.visual import _EDIT_COLOR_MAP, _edit_ffmpeg_fallback
+        result = _edit_ffmpeg_fallback(
+            edit_prompt="sacred blue robe, then red trim",
+            strength=50,
+            mask_path="/tmp/mask.mp4",
+            invert=False,
+        )
+        assert _EDIT_COLOR_MAP["red"] in result.filter_complex
+        result = _edit_ffmpeg_fallback(
+            edit_prompt="a sacred statue",
+            strength=50,
+            mask_path="/tmp/mask.mp4",
+            invert=False,
+        )
+        assert _EDIT_COLOR_MAP["red"] not in result.filter_complex
+
     def test_edit_fallback_unknown_prompt_uses_default(self):
         """Unknown edit prompt should use a default filter (not crash)."""
         from skills.handlers.visual import _edit_ffmpeg_fallback
@@ -14,6 +14,7 @@ from skills.handler_contract import HandlerResult
 
 from skills.handlers.spatial import (
     _f_resize, _f_crop, _f_pad, _f_rotate, _f_flip, _f_zoom, _f_ken_burns,
+    _f_frame_interpolation,
 )
 
 
@@ -87,11 +88,18 @@ class TestSpatialHandlers:
         assert fc == ""
         assert io == []
 
+    def test_frame_interpolation(self):
+        r = _f_frame_interpolation({"fps": 60})
+        assert r.video_filters == ["minterpolate=fps=60:mi_mode=mci"]
+        r = _f_frame_interpolation({"fps": 30, "mode": "dup"})
+        assert r.video_filters == ["fps=30"]
+
 
 # ── Temporal handlers ──────────────────────────────────────────────
 
 from skills.handlers.temporal import (
     _f_trim, _f_speed, _f_reverse, _f_loop, _f_boomerang, _f_jump_cut,
+    _f_scene_detect, _f_time_remap,
 )
 
 
@@ -109,6 +117,24 @@ class TestTemporalHandlers:
         t_idx = r.output_options.index("-t")
         assert float(r.output_options[t_idx + 1]) == 10.0
 
+    def test_trim_timestamp_uses_input_seek(self):
+        r = _f_trim({"start": "00:01:00", "end": "00:01:30.5"})
+        assert r.input_options == ["-ss", "00:01:00"]
+        assert r.output_options == ["-t", "30.5"]
+
+    def test_scene_detect(self):
+        r = _f_scene_detect({"threshold": 0.4, "keyframes_only": False})
+        assert r.video_filters == ["select='gt(scene,0.4)',setpts=N/FRAME_RATE/TB"]
+        assert r.input_options == []
+        r = _f_scene_detect({"threshold": 0.4, "keyframes_only": True})
+        assert r.input_options == ["-skip_frame", "nokey"]
+
+    def test_time_remap(self):
+        r = _f_time_remap({"start_speed": 1.0, "end_speed": 0.5})
+        assert r.video_filters == ["setpts=PTS/clip(1-0.1*T\\,0.1\\,10)"]
+        r = _f_time_remap({"start_speed": 0.5, "end_speed": 2.0, "_video_duration": 30})
+        assert r.video_filters == ["setpts=PTS/clip(0.5+0.05*T\\,0.1\\,10)"]
+
     def test_speed_normal(self):
         r = _f_speed({"factor": 2.0})
         assert len(r.video_filters) == 1
@@ -116,11 +142,21 @@ class TestTemporalHandlers:
         assert len(r.audio_filters) >= 1
         assert "atempo=" in r.audio_filters[0]
 
-    def test_speed_very_slow(self):
+    def test_speed_very_slow(self, monkeypatch):
         """Factor < 0.5 should chain multiple atempo filters."""
+        import skills.handlers.temporal as temporal_mod
+        monkeypatch.setattr(temporal_mod, "_available_filters", lambda: frozenset())
         r = _f_speed({"factor": 0.25})
         assert len(r.audio_filters) >= 2  # Multiple atempo needed for < 0.5
 
+    def test_speed_extreme_uses_rubberband(self, monkeypatch):
+        import skills.handlers.temporal as temporal_mod
+        monkeypatch.setattr(
+            temporal_mod, "_available_filters", lambda: frozenset({"rubberband"}),
+        )
+        assert _f_speed({"factor": 8.0}).audio_filters == ["rubberband=tempo=8.0"]
+        assert _f_speed({"factor": 1.5}).audio_filters == ["atempo=1.5"]
+
     def test_reverse(self):
         r = _f_reverse({})
         assert "reverse" in r.video_filters
@@ -148,7 +184,7 @@ class TestTemporalHandlers:
 # ── Audio handlers ─────────────────────────────────────────────────
 
 from skills.handlers.audio import (
-    _f_volume, _f_normalize, _f_fade_audio, _f_remove_audio,
+    _f_volume, _f_normalize, _f_pitch, _f_fade_audio, _f_remove_audio,
     _f_replace_audio, _f_mix_audio, _f_audio_crossfade,
 )
 
@@ -165,6 +201,71 @@ class TestAudioHandlers:
         r = _f_normalize({})
         assert r.audio_filters == ["loudnorm"]
 
+    def test_normalize_static_gain_uses_measurement(self, monkeypatch):
+        import skills.handlers.audio as audio_mod
+        monkeypatch.setattr(
+            audio_mod, "_measure_loudness",
+            lambda path: {"input_i": "-30.00", "input_tp": "-8.0",
+                          "input_lra": "5.0", "input_thresh": "-40.0",
+                          "target_offset": "0.1"},
+        )
+        r = _f_normalize({"engine": "static_gain", "_input_path": "x.mp4"})
+        assert r.audio_filters == ["volume=6.00dB"]
+        r = _f_normalize({"engine": "loudnorm_2pass", "_input_path": "x.mp4"})
+        assert "measured_I=-30.00" in r.audio_filters[0]
+        assert r.audio_filters[0].endswith(":linear=true")
+
+    def test_normalize_static_gain_respects_true_peak(self, monkeypatch):
+        import skills.handlers.audio as audio_mod
+        monkeypatch.setattr(
+            audio_mod, "_measure_loudness",
+            lambda path: {"input_i": "-40.00", "input_tp": "-1.0",
+                          "input_lra": "5.0", "input_thresh": "-50.0",
+                          "target_offset": "0.1"},
+        )
+        # +16 dB on a -1 dBTP peak would clip; loudnorm limits instead
+        r = _f_normalize({"engine": "static_gain", "_input_path": "x.mp4"})
+        assert r.audio_filters[0].startswith("loudnorm=")
+        assert "measured_TP=-1.0" in r.audio_filters[0]
+
+    def test_normalize_falls_back_without_measurement(self):
+        r = _f_normalize({"engine": "static_gain", "_input_path": "/nonexistent.mp4"})
+        assert r.audio_filters == ["loudnorm"]
+
+    def test_normalize_skips_measurement_after_audio_change(self, monkeypatch):
+        import skills.handlers.audio as audio_mod
+
+        def fail(path):
+            raise AssertionError("must not measure modified audio")
+
+        monkeypatch.setattr(audio_mod, "_measure_loudness", fail)
+        r = _f_normalize({"engine": "static_gain", "_input_path": "x.mp4",
+                          "_audio_modified": True})
+        assert r.audio_filters == ["loudnorm"]
+
+    def test_measure_loudness_timeout_falls_back(self, monkeypatch):
+        import subprocess
+
+        import skills.handlers.audio as audio_mod
+
+        def timeout(cmd, **kwargs):
+            raise subprocess.TimeoutExpired(cmd, kwargs.get("timeout"))
+
+        monkeypatch.setattr(audio_mod.subprocess, "run", timeout)
+        audio_mod._measure_loudness_cached.cache_clear()
+        try:
+            assert audio_mod._measure_loudness_cached("t.mp4", 1, 1) is None
+        finally:
+            audio_mod._measure_loudness_cached.cache_clear()
+
+    def test_pitch_uses_input_sample_rate(self):
+        r = _f_pitch({"semitones": 12, "_input_sample_rate": 48000})
+        assert r.audio_filters == ["asetrate=96000,aresample=48000"]
+
+    def test_pitch_defaults_to_44100(self):
+        r = _f_pitch({"semitones": -12})
+        assert r.audio_filters == ["asetrate=22050,aresample=44100"]
+
     def test_fade_audio_in(self):
         r = _f_fade_audio({"type": "in", "start": 0, "duration": 2})
         assert len(r.audio_filters) == 1
@@ -200,7 +301,7 @@ class TestAudioHandlers:
 
 from skills.handlers.visual import (
     _f_brightness, _f_contrast, _f_saturation, _f_fade,
-    _f_chromakey, _f_glow, _f_mask_blur, _f_vignette,
+    _f_chromakey, _f_glow, _f_mask_blur, _f_vignette, _f_colorbalance,
 )
 
 
@@ -210,6 +311,12 @@ class TestVisualHandlers:
         r = _f_brightness({"value": 0.1})
         assert r.video_filters == ["eq=brightness=0.1"]
 
+    def test_colorbalance_drops_zero_options(self):
+        r = _f_colorbalance({"rs": 0.3, "gs": 0, "bs": -0.2, "rm": 0.0, "gm": 0, "bm": 0})
+        assert r.video_filters == ["colorbalance=rs=0.3:bs=-0.2"]
+        r = _f_colorbalance({"rs": 0, "gs": 0, "bs": 0, "rm": 0, "gm": 0, "bm": 0})
+        assert r.video_filters == []
+
     def test_contrast(self):
         r = _f_contrast({"value": 1.5})
         assert "eq=contrast=1.5" in r.video_filters[0]
@@ -387,6 +494,7 @@ class TestMultiInputHandlers:
 
 from skills.handlers.encoding import (
     _f_compress, _f_convert, _f_quality, _f_gif, _f_hwaccel,
+    _f_bitrate, _f_two_pass,
 )
 
 
@@ -407,10 +515,40 @@ class TestEncodingHandlers:
         r = _f_convert({"codec": "h265"})
         assert "libx265" in r.output_options
 
+    def test_convert_auto_encoder(self, monkeypatch):
+        import skills.handlers.encoding as enc_mod
+        monkeypatch.setattr(enc_mod, "_encoder_works", lambda e: e == "hevc_nvenc")
+        r = _f_convert({"codec": "h265", "encoder": "auto"})
+        assert r.output_options == ["-c:v", "hevc_nvenc"]
+        r = _f_convert({"codec": "h264", "encoder": "auto"})
+        assert r.output_options == ["-c:v", "libx264"]
+        r = _f_convert({"codec": "h265"})
+        assert r.output_options == ["-c:v", "libx265"]
+
     def test_quality(self):
         r = _f_quality({"crf": 18, "preset": "slow"})
         assert "18" in r.output_options
         assert "slow" in r.output_options
+        assert r.output_options[:2] == ["-c:v", "libx264"]
+
+    def test_quality_after_encoder_choice(self):
+        r = _f_quality({"crf": 18, "preset": "slow", "_video_codec": "libx265"})
+        assert r.output_options == ["-crf", "18", "-preset", "slow"]
+
+    def test_two_pass_vbv(self):
+        r = _f_two_pass({"target_bitrate": "4M"})
+        assert r.output_options == [
+            "-b:v", "4M", "-maxrate", "6000k", "-bufsize", "8000k",
+        ]
+
+    def test_bitrate_vbv(self):
+        r = _f_bitrate({"video": "2500k", "audio": "128k"})
+        assert r.output_options == [
+            "-b:v", "2500k", "-maxrate", "3750k", "-bufsize", "5000k",
+            "-b:a", "128k",
+        ]
+        r = _f_bitrate({"video": "fast"})
+        assert r.output_options == ["-b:v", "fast"]
 
     def test_gif(self):
         r = _f_gif({"width": 320, "fps": 10})
@@ -423,3 +561,13 @@ class TestEncodingHandlers:
         assert isinstance(r, HandlerResult)
         assert "-hwaccel" in r.input_options
         assert "cuda" in r.input_options
+
+    def test_hwaccel_gpu_encoder(self):
+        r = _f_hwaccel({"type": "cuda", "codec": "h265"})
+        assert r.input_options == ["-hwaccel", "cuda"]
+        assert r.output_options == ["-c:v", "hevc_nvenc"]
+
+    def test_hwaccel_falls_back_to_decode_only(self):
+        r = _f_hwaccel({"type": "vaapi", "codec": "h264"})
+        assert r.input_options == ["-hwaccel", "vaapi"]
+        assert r.output_options == []
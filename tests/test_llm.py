@@ -1,6 +1,7 @@
 """Tests for the LLM integration."""
 
 import json
+from unittest.mock import patch
 
 from core.llm.base import LLMConfig, LLMProvider, LLMResponse
 from core.llm.ollama import OllamaConnector
@@ -139,6 +140,100 @@ class TestPromptTemplates:
         # Should be shorter
         assert len(prompt) < 20000  # Reasonable size
 
+    def test_system_prompt_segments_interned(self):
+        """Pre-split static segments are interned and render like format()."""
+        import sys
+
+        from prompts.system import (
+            _SYSTEM_PROMPT_SEGMENTS,
+            SYSTEM_PROMPT_TEMPLATE,
+            _render_segments,
+        )
+
+        for literal, _field in _SYSTEM_PROMPT_SEGMENTS:
+            assert sys.intern(literal) is literal
+
+        values = {
+            "skill_registry": "REG",
+            "video_metadata": "META",
+            "connected_inputs": "INPUTS",
+        }
+        assert _render_segments(_SYSTEM_PROMPT_SEGMENTS, **values) == (
+            SYSTEM_PROMPT_TEMPLATE.format(**values)
+        )
+
+    def test_rendered_prompt_cache(self):
+        """Identical inputs reuse the cached prompt until the registry changes."""
+        from skills.registry import Skill, SkillCategory, get_registry
+
+        first = get_system_prompt(video_metadata="cache probe")
+        with patch(
+            "prompts.system.iter_system_prompt_segments",
+            side_effect=AssertionError("cache hit must not re-render"),
+        ):
+            assert get_system_prompt(video_metadata="cache probe") is first
+
+        registry = get_registry()
+        registry.register(Skill(
+            name="zz_cache_probe",
+            category=SkillCategory.CUSTOM,
+            description="Probe skill",
+        ))
+        try:
+            assert "zz_cache_probe" in get_system_prompt(video_metadata="cache probe")
+        finally:
+            registry.reload()
+
+    def test_abbreviated_registry_memoized_per_version(self):
+        """Abbreviated listing is reused until the registry changes."""
+        from prompts.system import _abbreviated_registry_str
+        from skills.registry import Skill, SkillCategory, get_registry
+
+        registry = get_registry()
+        get_system_prompt(include_full_registry=False, video_metadata="a")
+        hits = _abbreviated_registry_str.cache_info().hits
+        get_system_prompt(include_full_registry=False, video_metadata="b")
+        assert _abbreviated_registry_str.cache_info().hits == hits + 1
+
+        registry.register(Skill(
+            name="zz_memo_probe",
+            category=SkillCategory.CUSTOM,
+            description="Probe skill",
+        ))
+        try:
+            assert "zz_memo_probe" in get_system_prompt(include_full_registry=False)
+        finally:
+            registry.reload()
+
+    def test_iter_system_prompt_segments(self):
+        """Streaming segments join to the full prompt; metadata is uncached."""
+        from prompts.system import iter_system_prompt_segments
+
+        segments = list(iter_system_prompt_segments(video_metadata="clip.mp4"))
+        assert "".join(text for text, _ in segments) == get_system_prompt(
+            video_metadata="clip.mp4"
+        )
+        assert ("clip.mp4", False) in segments
+        assert segments[0][1] is True
+
+    def test_system_prompt_blocks(self):
+        """Registry is split per category and one cache breakpoint is set."""
+        from prompts.system import get_system_prompt_blocks
+        from skills.registry import get_registry
+
+        blocks = get_system_prompt_blocks(video_metadata="clip.mp4")
+        assert "".join(b["text"] for b in blocks) == get_system_prompt(
+            video_metadata="clip.mp4"
+        )
+
+        texts = [b["text"] for b in blocks]
+        for _category, chunk in get_registry().iter_prompt_chunks():
+            assert chunk in texts
+
+        marked = [i for i, b in enumerate(blocks) if "cache_control" in b]
+        assert len(marked) == 1
+        assert marked[0] < texts.index("clip.mp4")
+
     def test_generation_prompt(self):
         """Test generation prompt."""
         user_request = "Make it cinematic"
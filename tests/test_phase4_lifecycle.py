@@ -52,6 +52,25 @@ class TestSkillRegistryReload:
         count2 = registry.reload()
         assert count1 == count2
 
+    def test_default_registration_runs_once_per_registry(self):
+        from skills.registry import SkillRegistry, _register_default_skills
+        registry = SkillRegistry()
+        _register_default_skills(registry)
+        version = registry.version
+        count = len(registry.list_all())
+        _register_default_skills(registry)
+        assert registry.version == version
+        assert len(registry.list_all()) == count
+
+    def test_reload_reuses_builtin_skills(self):
+        from skills.registry import get_registry
+        registry = get_registry()
+        before = registry.get("blur")
+        prompt = registry.to_prompt_string()
+        registry.reload()
+        assert registry.get("blur") is before
+        assert registry.to_prompt_string() == prompt
+
 
 # ── SkillRegistry file-watcher ────────────────────────────────────────
 
@@ -1,5 +1,9 @@
 """Tests for the skill system."""
 
+import dataclasses
+import sys
+
+import pytest
 
 from skills.registry import (
     SkillRegistry,
@@ -9,7 +13,7 @@ from skills.registry import (
     ParameterType,
     get_registry,
 )
-from skills.composer import SkillComposer, Pipeline
+from skills.composer import SkillComposer, Pipeline, PipelineStep
 
 
 class TestSkillParameter:
@@ -28,6 +32,33 @@ class TestSkillParameter:
         assert not is_valid
         assert "required" in error.lower()
 
+    def test_parameter_is_frozen_and_slotted(self):
+        """Shared parameter definitions cannot be rebound and carry no __dict__."""
+        param = SkillParameter(
+            name="width", type=ParameterType.INT, description="Output width",
+        )
+        assert not hasattr(param, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            param.default = 5
+
+    def test_open_ended_range_validation(self):
+        """A missing bound never rejects; the present one reports itself."""
+        param = SkillParameter(
+            name="gain", type=ParameterType.FLOAT, description="Gain",
+            max_value=20,
+        )
+        assert param.validate(-1e9) == (True, None)
+        is_valid, error = param.validate(21.0)
+        assert not is_valid
+        assert error == "Parameter 'gain' must be <= 20"
+
+        param = SkillParameter(
+            name="delay", type=ParameterType.INT, description="Delay",
+            min_value=50,
+        )
+        assert param.validate(10**9) == (True, None)
+        assert param.validate(10) == (False, "Parameter 'delay' must be >= 50")
+
     def test_int_parameter_validation(self):
         """Test integer parameter validation."""
         param = SkillParameter(
@@ -184,6 +215,95 @@ class TestSkill:
 
         assert skill.get_param("nonexistent") is None
 
+    def test_render_template_precompiled(self):
+        """Template renders from params, then defaults, else stays literal."""
+        skill = Skill(
+            name="test",
+            category=SkillCategory.AUDIO,
+            description="Test skill",
+            parameters=[
+                SkillParameter(
+                    name="gain",
+                    type=ParameterType.FLOAT,
+                    description="Gain",
+                    default=6,
+                ),
+            ],
+            ffmpeg_template="bass=g={gain}:f={frequency}",
+        )
+
+        assert skill.render_template({}) == "bass=g=6:f={frequency}"
+        assert skill.render_template({"gain": 3, "frequency": 80}) == "bass=g=3:f=80"
+        assert skill.render_template(
+            {"frequency": "x"}, escape=str.upper,
+        ) == "bass=g=6:f=X"
+
+        skill.ffmpeg_template = "volume={gain}"
+        assert skill.render_template({}) == "volume=6"
+
+    def test_examples_stored_as_tuple(self):
+        """Examples passed as a list are held as an immutable tuple."""
+        skill = Skill(
+            name="test",
+            category=SkillCategory.AUDIO,
+            description="Test skill",
+            examples=["test - one", "test:x=1 - two"],
+        )
+        assert skill.examples == ("test - one", "test:x=1 - two")
+        assert Skill(
+            name="bare", category=SkillCategory.AUDIO, description="Bare",
+        ).examples == ()
+
+    def test_constant_templates_render_without_formatting(self):
+        """Placeholder-free templates come back as the template object itself."""
+        registry = get_registry()
+        for name in ("stereo_swap", "mono", "audio_reverse"):
+            skill = registry.get(name)
+            assert "{" not in skill.ffmpeg_template
+            assert skill.render_template({"_input_path": "/in.mp4"}) is skill.ffmpeg_template
+
+    def test_default_skills_not_shared_across_registries(self):
+        """Each registry builds its own built-in Skill objects."""
+        from skills.registry import _register_default_skills
+
+        first, second = SkillRegistry(), SkillRegistry()
+        _register_default_skills(first)
+        _register_default_skills(second)
+        for name in ("compress", "resize", "trim", "brightness", "volume"):
+            assert first.get(name) is not second.get(name)
+            assert first.get(name).name == second.get(name).name
+
+    def test_param_names_frozen(self):
+        """Declared parameter names are precomputed; no-param skills share one set."""
+        registry = get_registry()
+        assert registry.get("bass")._param_names == {"gain", "frequency"}
+        assert registry.get("mono")._param_names is registry.get("stereo_swap")._param_names
+
+    def test_render_pipeline_precompiled(self):
+        """Pipeline steps fill like templates; literal steps pass through."""
+        skill = Skill(
+            name="test",
+            category=SkillCategory.VISUAL,
+            description="Test skill",
+            parameters=[
+                SkillParameter(
+                    name="amount",
+                    type=ParameterType.FLOAT,
+                    description="Amount",
+                    default=0.5,
+                ),
+            ],
+            pipeline=["blur:strength={amount}", "grayscale", "crop:w={w}"],
+        )
+
+        assert skill.render_pipeline({}) == [
+            "blur:strength=0.5", "grayscale", "crop:w={w}",
+        ]
+        assert skill.render_pipeline({"amount": 2, "w": 10})[::2] == [
+            "blur:strength=2", "crop:w=10",
+        ]
+        assert skill.render_pipeline({"amount": "{w}", "w": 1})[0] == "blur:strength={w}"
+
 
 class TestSkillRegistry:
     """Tests for SkillRegistry class."""
@@ -320,6 +440,88 @@ class TestSkillRegistry:
         assert "Available Skills" in prompt_str
         assert "temporal" in prompt_str.lower() or "Temporal" in prompt_str
 
+    def test_batch_parallel_hint(self):
+        """Only stream-copy skills opt into wider batch concurrency."""
+        registry = get_registry()
+        assert registry.get("extract_audio").batch_parallel > 1
+        assert registry.get("bass").batch_parallel == 1
+
+    def test_batch_filter_threads_split_cores(self, monkeypatch):
+        """Concurrent batch jobs split the cores between their filter graphs."""
+        pytest.importorskip("torch")
+        from nodes import batch_processor
+
+        monkeypatch.setattr(batch_processor.os, "cpu_count", lambda: 8)
+        registry = get_registry()
+
+        workers = batch_processor._batch_worker_count(registry, [{"skill": "bass"}], 1, 10)
+        assert batch_processor._batch_filter_threads(workers) == 0
+
+        workers = batch_processor._batch_worker_count(registry, [{"skill": "bass"}], 2, 10)
+        assert workers == 2
+        assert batch_processor._batch_filter_threads(workers) == 4
+
+    def test_list_by_tag_tracks_reregistration(self):
+        """Tag index holds skills directly and drops replaced definitions."""
+        registry = SkillRegistry()
+        first = Skill(name="a", category=SkillCategory.AUDIO,
+                      description="A", tags=["eq"])
+        registry.register(first)
+        registry.register(Skill(name="b", category=SkillCategory.AUDIO,
+                                description="B", tags=["eq", "filter"]))
+        assert [s.name for s in registry.list_by_tag("eq")] == ["a", "b"]
+        assert registry.list_by_tag("eq")[0] is first
+
+        registry.register(Skill(name="a", category=SkillCategory.AUDIO,
+                                description="A2", tags=["filter"]))
+        assert [s.name for s in registry.list_by_tag("eq")] == ["b"]
+        assert [s.description for s in registry.list_by_tag("filter")] == ["B", "A2"]
+        assert registry.list_by_tag("missing") == []
+
+    def test_identical_parameters_are_shared(self):
+        """Identical parameter definitions collapse to one instance."""
+        registry = get_registry()
+        assert (
+            registry.get("fade").get_param("duration")
+            is registry.get("fade_audio").get_param("duration")
+        )
+        assert (
+            registry.get("bass").get_param("gain")
+            is not registry.get("treble").get_param("gain")
+        )
+        film = registry.get("film_burn").get_param("color")
+        leak = registry.get("light_leak").get_param("color")
+        assert film.choices is leak.choices
+
+    def test_names_and_tags_interned(self):
+        """Runtime-built names and tags share the interned string object."""
+        name = "".join(["my", "_skill"])
+        tag = "".join(["lo", "fi"])
+        skill = Skill(
+            name=name,
+            category=SkillCategory.AUDIO,
+            description="Test",
+            parameters=[SkillParameter(
+                name="".join(["ga", "in_x"]), type=ParameterType.FLOAT,
+                description="Gain", required=False, default=1.0,
+            )],
+            tags=[tag],
+        )
+        assert skill.name is sys.intern("my_skill")
+        assert skill.tags[0] is sys.intern("lofi")
+        assert skill.parameters[0].name is sys.intern("gain_x")
+        choice = SkillParameter(
+            name="mode", type=ParameterType.CHOICE, description="Mode",
+            choices=("".join(["fa", "st"]),),
+        )
+        assert choice.choices[0] is sys.intern("fast")
+        assert next(iter(choice._choice_map)) is sys.intern("fast")
+
+        registry = SkillRegistry()
+        registry.register(skill)
+        registry.register_alias("".join(["my", "_alias"]), "my_skill")
+        assert next(k for k in registry._skills if k == "my_alias") is sys.intern("my_alias")
+
     def test_typewriter_text_max_length(self):
         """Verify that typewriter_text skill has max_length enforced."""
         registry = get_registry()
@@ -408,6 +610,187 @@ class TestSkillComposer:
 
         assert "scale" in cmd_str or "-vf" in cmd_str
 
+    def test_eq_adjust_single_pass(self):
+        """eq_adjust renders every tone knob into one eq filter."""
+        composer = SkillComposer()
+        pipeline = Pipeline(input_path="/input.mp4", output_path="/output.mp4")
+        pipeline.add_step("eq_adjust", {"contrast": 1.2, "gamma": 0.9})
+        args = composer.compose(pipeline).to_args()
+        assert args[args.index("-vf") + 1] == (
+            "eq=brightness=0.0:contrast=1.2:saturation=1.0:gamma=0.9"
+        )
+
+    def test_adjacent_eq_filters_fused(self):
+        """brightness + saturation share one eq pass; luma ops stay apart."""
+        composer = SkillComposer()
+        pipeline = Pipeline(input_path="/input.mp4", output_path="/output.mp4")
+        pipeline.add_step("brightness", {"value": 0.1})
+        pipeline.add_step("saturation", {"value": 1.2})
+        pipeline.add_step("contrast", {"value": 1.3})
+        args = composer.compose(pipeline).to_args()
+        assert args[args.index("-vf") + 1] == (
+            "eq=brightness=0.1:saturation=1.2,eq=contrast=1.3"
+        )
+
+    def test_normalize_after_audio_step_uses_single_pass(self, monkeypatch):
+        """Only a normalize that sees the untouched input audio measures it."""
+        import skills.handlers.audio as audio_mod
+        measured = []
+
+        def measure(path):
+            measured.append(path)
+            return {"input_i": "-30.00", "input_tp": "-8.0", "input_lra": "5.0",
+                    "input_thresh": "-40.0", "target_offset": "0.1"}
+
+        monkeypatch.setattr(audio_mod, "_measure_loudness", measure)
+        composer = SkillComposer()
+
+        pipeline = Pipeline(input_path="/input.mp4", output_path="/output.mp4")
+        pipeline.add_step("normalize", {"engine": "static_gain"})
+        args = composer.compose(pipeline).to_args()
+        assert args[args.index("-af") + 1] == "volume=6.00dB"
+        assert measured == ["/input.mp4"]
+
+        for first, params in (("volume", {"level": 2.0}), ("trim", {"start": 5})):
+            measured.clear()
+            pipeline = Pipeline(input_path="/input.mp4", output_path="/output.mp4")
+            pipeline.add_step(first, params)
+            pipeline.add_step("normalize", {"engine": "static_gain"})
+            args = composer.compose(pipeline).to_args()
+            assert "loudnorm" in args[args.index("-af") + 1]
+            assert measured == []
+
+    def test_normalize_before_trim_uses_single_pass(self, monkeypatch):
+        """A later trim cuts the audio too, so the whole file is not measured."""
+        import skills.handlers.audio as audio_mod
+        measured = []
+        monkeypatch.setattr(audio_mod, "_measure_loudness", measured.append)
+        composer = SkillComposer()
+
+        pipeline = Pipeline(input_path="/input.mp4", output_path="/output.mp4")
+        pipeline.add_step("normalize", {"engine": "static_gain"})
+        pipeline.add_step("bass", {"gain": 4})
+        pipeline.add_step("trim", {"start": 10, "duration": 5})
+        args = composer.compose(pipeline).to_args()
+        af = args[args.index("-af") + 1]
+        assert af.startswith("loudnorm,")
+        assert "volume=" not in af
+        assert measured == []
+
+    def test_quality_keeps_earlier_encoder(self, monkeypatch):
+        """The quality step the nodes append last keeps convert's encoder."""
+        import skills.handlers.encoding as enc_mod
+        monkeypatch.setattr(enc_mod, "_encoder_works", lambda e: False)
+        composer = SkillComposer()
+        pipeline = Pipeline(input_path="/input.mp4", output_path="/output.mp4")
+        pipeline.add_step("convert", {"codec": "h265", "encoder": "auto"})
+        pipeline.add_step("quality", {"crf": 20, "preset": "slow"})
+        args = composer.compose(pipeline).to_args()
+        assert args.count("-c:v") == 1
+        assert args[args.index("-c:v") + 1] == "libx265"
+        assert args[args.index("-crf") + 1] == "20"
+        assert args[args.index("-preset") + 1] == "slow"
+
+        pipeline = Pipeline(input_path="/input.mp4", output_path="/output.mp4")
+        pipeline.add_step("quality", {"crf": 20, "preset": "slow"})
+        args = composer.compose(pipeline).to_args()
+        assert args[args.index("-c:v") + 1] == "libx264"
+
+    def test_crf_translated_for_nvenc(self):
+        """x264 CRF/preset become NVENC CQ/preset when NVENC encodes."""
+        composer = SkillComposer()
+        pipeline = Pipeline(input_path="/input.mp4", output_path="/output.mp4")
+        pipeline.add_step("quality", {"crf": 23, "preset": "slow"})
+        args = composer.compose(pipeline).to_args()
+        assert args[args.index("-crf") + 1] == "23"
+
+        # Nodes append quality after the LLM's steps
+        pipeline.steps.insert(0, PipelineStep(
+            skill_name="hwaccel", params={"type": "cuda", "codec": "h264"},
+        ))
+        args = composer.compose(pipeline).to_args()
+        assert args.count("-c:v") == 1
+        assert args[args.index("-c:v") + 1] == "h264_nvenc"
+        assert "-crf" not in args
+        i = args.index("-cq")
+        assert args[i:i + 2] == ["-cq", "20"]
+        assert args[args.index("-preset") + 1] == "p5"
+        assert args[args.index("-rc") + 1] == "vbr"
+        assert args[args.index("-b:v") + 1] == "0"
+
+    def test_crf_translated_for_videotoolbox(self):
+        """VideoToolbox gets -q:v for the CRF and no x264 preset."""
+        composer = SkillComposer()
+        pipeline = Pipeline(input_path="/input.mp4", output_path="/output.mp4")
+        pipeline.add_step("hwaccel", {"type": "videotoolbox", "codec": "h264"})
+        pipeline.add_step("quality", {"crf": 23, "preset": "slow"})
+        args = composer.compose(pipeline).to_args()
+        assert args[args.index("-c:v") + 1] == "h264_videotoolbox"
+        assert args[args.index("-q:v") + 1] == "60"
+        assert "-crf" not in args
+        assert "-preset" not in args
+
+    def test_cuda_transcode_keeps_frames_on_gpu(self):
+        """CUDA decode straight into NVENC sets -hwaccel_output_format."""
+        composer = SkillComposer()
+        pipeline = Pipeline(input_path="/input.mp4", output_path="/output.mp4")
+        pipeline.add_step("hwaccel", {"type": "cuda"})
+        args = composer.compose(pipeline).to_args()
+        assert "-hwaccel_output_format" not in args  # software encoder
+
+        pipeline.steps[0].params["codec"] = "h264"
+        pipeline.add_step("quality", {"crf": 23, "preset": "medium"})
+        args = composer.compose(pipeline).to_args()
+        assert args[args.index("-c:v") + 1] == "h264_nvenc"
+        assert "-cq" in args
+        assert args[args.index("-hwaccel_output_format") + 1] == "cuda"
+        assert "-vf" not in args
+
+        pipeline.steps.insert(1, PipelineStep(skill_name="grayscale", params={}))
+        args = composer.compose(pipeline).to_args()
+        assert "-hwaccel_output_format" not in args
+
+    def test_scale_2x_uses_scale_cuda_on_nvenc(self, monkeypatch):
+        """CUDA decode + scale_2x + NVENC keeps frames in GPU memory."""
+        import skills.handlers.encoding as enc_mod
+        monkeypatch.setattr(
+            enc_mod, "_available_filters", lambda: frozenset({"scale_cuda"}),
+        )
+        composer = SkillComposer()
+        pipeline = Pipeline(input_path="/input.mp4", output_path="/output.mp4")
+        pipeline.add_step("scale_2x", {"factor": 2, "algorithm": "spline"})
+        args = composer.compose(pipeline).to_args()
+        assert args[args.index("-vf") + 1] == "scale=iw*2:ih*2:flags=spline"
+
+        pipeline.add_step("hwaccel", {"type": "cuda", "codec": "h265"})
+        pipeline.add_step("quality", {"crf": 23, "preset": "medium"})
+        args = composer.compose(pipeline).to_args()
+        assert args[args.index("-c:v") + 1] == "hevc_nvenc"
+        assert args[args.index("-hwaccel_output_format") + 1] == "cuda"
+        assert args.index("-hwaccel_output_format") < args.index("-i")
+        assert args[args.index("-vf") + 1] == (
+            "scale_cuda=w=iw*2:h=ih*2:interp_algo=lanczos"
+        )
+
+        pipeline.steps.insert(2, PipelineStep(skill_name="grayscale", params={}))
+        args = composer.compose(pipeline).to_args()
+        assert "-hwaccel_output_format" not in args
+        assert "scale=iw*2:ih*2:flags=spline" in args[args.index("-vf") + 1]
+
+    def test_filter_threads_metadata(self):
+        """_filter_threads caps filter graph threads via global options."""
+        composer = SkillComposer()
+        pipeline = Pipeline(input_path="/input.mp4", output_path="/output.mp4")
+        pipeline.add_step("bass", {"gain": 6})
+        assert "-filter_threads" not in composer.compose(pipeline).to_args()
+
+        pipeline.metadata["_filter_threads"] = 2
+        args = composer.compose(pipeline).to_args()
+        i = args.index("-filter_threads")
+        assert args[i + 1] == "2"
+        assert args[args.index("-filter_complex_threads") + 1] == "2"
+        assert i < args.index("-i")
+
     def test_validate_pipeline(self):
         """Test pipeline validation."""
         composer = SkillComposer()
@@ -664,6 +1047,24 @@ class TestSkillComposer:
         assert "-af" in args, f"echo should produce -af but got: {args}"
         assert "-vf" not in args
 
+    def test_stacked_audio_templates_fuse_into_one_af_chain(self):
+        """Several single-node audio skills compose into one -af chain."""
+        composer = SkillComposer()
+        pipeline = Pipeline(input_path="/in.mp4", output_path="/out.mp4")
+        pipeline.add_step("bass", {"gain": 6, "frequency": 100})
+        pipeline.add_step("treble", {"gain": 3, "frequency": 3000})
+        pipeline.add_step("compress_audio", {})
+        pipeline.add_step("echo", {"delay": 500, "decay": 0.5})
+
+        args = composer.compose(pipeline).to_args()
+
+        assert args.count("-af") == 1
+        assert args.count("-i") == 1
+        chain = args[args.index("-af") + 1].split(",")
+        assert [node.split("=", 1)[0] for node in chain] == [
+            "bass", "treble", "acompressor", "aecho",
+        ]
+
     def test_mixed_video_and_audio_pipeline(self):
         """Pipeline with both video and audio skills should produce -vf and -af."""
         composer = SkillComposer()
@@ -68,6 +68,58 @@ def test_skill_registry_caching():
     assert "test_skill" in str(schema2)
     assert prompt2 != prompt1
 
+def test_prompt_block_rendered_on_first_prompt_build():
+    """Prompt blocks are deferred until a prompt is built; version bumps."""
+    registry = SkillRegistry()
+    version = registry.version
+
+    skill = Skill(
+        name="test_skill",
+        category=SkillCategory.VISUAL,
+        description="A test skill",
+        examples=["test_skill"],
+    )
+    registry.register(skill)
+
+    assert registry.version > version
+    version = registry.version
+    assert skill._category_title == "Visual"
+    assert skill._prompt_str == ""
+    prompt = registry.to_prompt_string()
+    assert skill._prompt_str.startswith("### test_skill\nA test skill\n")
+    assert skill._prompt_str in prompt
+
+    registry.register_alias("alias_skill", "test_skill")
+    assert registry.version > version
+    alias = registry.get("alias_skill")
+    assert alias._prompt_str == ""
+    assert "### alias_skill" in registry.to_prompt_string()
+
+
+def test_register_many_matches_register():
+    """Bulk registration indexes like register() with a single invalidation."""
+    def make():
+        return [
+            Skill(name="a", category=SkillCategory.AUDIO, description="A", tags=["eq"]),
+            Skill(name="b", category=SkillCategory.AUDIO, description="B", tags=["eq"]),
+            Skill(name="a", category=SkillCategory.AUDIO, description="A2"),
+        ]
+
+    one_by_one = SkillRegistry()
+    for skill in make():
+        one_by_one.register(skill)
+
+    bulk = SkillRegistry()
+    bulk.to_prompt_string()
+    version = bulk.version
+    bulk.register_many(make())
+
+    assert bulk.version > version
+    assert bulk._cached_prompt_string is None
+    assert bulk.to_prompt_string() == one_by_one.to_prompt_string()
+    assert [s.name for s in bulk.list_by_tag("eq")] == ["b"]
+
+
 def test_skill_registry_performance_benchmark():
     """Benchmark to prompt string generation performance."""
     registry = SkillRegistry()